@@ -5,11 +5,54 @@ Migration to v0.2.1
 Adds frontmatter to all planning documents and updates configuration.
 """
 
+import functools
 import json
 import os
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
+from typing import Iterator
+
+# Body section patterns for pre-frontmatter documents
+STATUS_PATTERN = re.compile(r'^## Status\s*\n\s*\n?([^\n#]+)', re.MULTILINE)
+DATE_PATTERN = re.compile(r'^## (?:Date|Created)\s*\n\s*\n?(\d{4}-\d{2}-\d{2})', re.MULTILINE)
+
+# Non-document markdown files in the planning tree
+SKIPPED_FILENAMES = ('template.md', 'roadmap.md')
+
+# Document type by planning subdirectory name (legacy and current)
+DIR_DOC_TYPES = {
+    'decision-records': 'adr',
+    'decisions': 'adr',
+    'feature-designs': 'fdp',
+    'designs': 'fdp',
+    'action-plans': 'ap',
+    'reports': 'report',
+}
+
+# Filename prefix and display ID format per document type
+DOC_ID_FORMATS = {
+    'adr': ('', 'ADR-{:03d}'),
+    'fdp': ('FDP-', 'FDP-{:03d}'),
+    'ap': ('AP-', 'AP-{:03d}'),
+    'report': ('RPT-', 'RPT-{:03d}'),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_json_loads():
+    """
+    Get the JSON parser for config files, importing it on first use.
+
+    Same as config.get_json_loads() in the planning scripts; migrations do
+    not import the scripts, so they carry their own copy.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
 
 
 def get_project_dir() -> Path:
@@ -22,12 +65,14 @@ def get_config_path(project_dir: Path) -> Path:
     return project_dir / '.claude' / 'vibe-hacker.json'
 
 
+@functools.lru_cache(maxsize=4)
 def load_config(project_dir: Path) -> dict:
-    """Load configuration from vibe-hacker.json."""
+    """Load configuration from vibe-hacker.json (cached until saved)."""
     config_path = get_config_path(project_dir)
     if config_path.exists():
         try:
-            return json.loads(config_path.read_text())
+            data = config_path.read_bytes()
+            return get_json_loads()(data)
         except (json.JSONDecodeError, IOError):
             return {}
     return {}
@@ -38,6 +83,7 @@ def save_config(project_dir: Path, config: dict) -> None:
     config_path = get_config_path(project_dir)
     config_path.parent.mkdir(parents=True, exist_ok=True)
     config_path.write_text(json.dumps(config, indent=2) + '\n')
+    load_config.cache_clear()
 
 
 def get_planning_root(config: dict) -> str:
@@ -58,6 +104,16 @@ def check_applicable(project_dir: Path) -> bool:
     return version < '0.2.0'
 
 
+def parse_filename_number(filename: str, prefix: str) -> int | None:
+    """Parse the number from a '<prefix><number>-...' filename."""
+    if not filename.startswith(prefix):
+        return None
+    number, sep, _ = filename[len(prefix):].partition('-')
+    if sep and number.isdecimal():
+        return int(number)
+    return None
+
+
 def infer_doc_type(filepath: Path, planning_root: Path) -> str | None:
     """Infer document type from file path and name."""
     rel_path = filepath.relative_to(planning_root)
@@ -69,16 +125,8 @@ def infer_doc_type(filepath: Path, planning_root: Path) -> str | None:
         if dir_name in ('archive',):
             dir_name = parts[1] if len(parts) > 1 else ''
 
-        dir_mappings = {
-            'decision-records': 'adr',
-            'decisions': 'adr',
-            'feature-designs': 'fdp',
-            'designs': 'fdp',
-            'action-plans': 'ap',
-            'reports': 'report',
-        }
-        if dir_name in dir_mappings:
-            return dir_mappings[dir_name]
+        if dir_name in DIR_DOC_TYPES:
+            return DIR_DOC_TYPES[dir_name]
 
     # Check filename prefix
     filename = filepath.name
@@ -88,7 +136,7 @@ def infer_doc_type(filepath: Path, planning_root: Path) -> str | None:
         return 'ap'
     elif filename.startswith('RPT-'):
         return 'report'
-    elif re.match(r'^\d+-', filename):
+    elif parse_filename_number(filename, '') is not None:
         return 'adr'
 
     return None
@@ -96,22 +144,12 @@ def infer_doc_type(filepath: Path, planning_root: Path) -> str | None:
 
 def extract_doc_id(filepath: Path, doc_type: str) -> str | None:
     """Extract document ID from filename."""
-    filename = filepath.name
-
-    patterns = {
-        'adr': (r'^(\d+)-', 'ADR-{:03d}'),
-        'fdp': (r'^FDP-(\d+)-', 'FDP-{:03d}'),
-        'ap': (r'^AP-(\d+)-', 'AP-{:03d}'),
-        'report': (r'^RPT-(\d+)-', 'RPT-{:03d}'),
-    }
-
-    if doc_type not in patterns:
+    if doc_type not in DOC_ID_FORMATS:
         return None
 
-    pattern, format_str = patterns[doc_type]
-    match = re.match(pattern, filename)
-    if match:
-        number = int(match.group(1))
+    prefix, format_str = DOC_ID_FORMATS[doc_type]
+    number = parse_filename_number(filepath.name, prefix)
+    if number is not None:
         return format_str.format(number)
 
     return None
@@ -119,7 +157,7 @@ def extract_doc_id(filepath: Path, doc_type: str) -> str | None:
 
 def extract_status_from_content(content: str) -> str:
     """Extract status from ## Status section."""
-    match = re.search(r'^## Status\s*\n\s*\n?([^\n#]+)', content, re.MULTILINE)
+    match = STATUS_PATTERN.search(content)
     if match:
         return match.group(1).strip().lower()
     return 'proposed'
@@ -127,7 +165,7 @@ def extract_status_from_content(content: str) -> str:
 
 def extract_date_from_content(content: str) -> str | None:
     """Extract date from ## Date or ## Created section."""
-    match = re.search(r'^## (?:Date|Created)\s*\n\s*\n?(\d{4}-\d{2}-\d{2})', content, re.MULTILINE)
+    match = DATE_PATTERN.search(content)
     if match:
         return match.group(1)
     return None
@@ -138,9 +176,14 @@ def has_frontmatter(content: str) -> bool:
     return content.startswith('---\n')
 
 
-def create_frontmatter(doc_type: str, doc_id: str, status: str, created: str) -> str:
+def file_has_frontmatter(filepath: Path) -> bool:
+    """Check if a file already has frontmatter without reading its body."""
+    with filepath.open(encoding='utf-8') as f:
+        return has_frontmatter(f.read(4))
+
+
+def create_frontmatter(doc_type: str, doc_id: str, status: str, created: str, today: str) -> str:
     """Create YAML frontmatter string."""
-    today = datetime.now().strftime('%Y-%m-%d')
     return f"""---
 type: {doc_type}
 id: {doc_id}
@@ -156,13 +199,12 @@ related: []
 """
 
 
-def migrate_document(filepath: Path, planning_root: Path) -> dict:
+def migrate_document(filepath: Path, planning_root: Path, today: str) -> dict:
     """
     Migrate a single document to v0.2.1 format.
 
     Returns dict with migration details.
     """
-    content = filepath.read_text()
     result = {
         'path': str(filepath),
         'status': 'skipped',
@@ -170,7 +212,7 @@ def migrate_document(filepath: Path, planning_root: Path) -> dict:
     }
 
     # Skip if already has frontmatter
-    if has_frontmatter(content):
+    if file_has_frontmatter(filepath):
         result['reason'] = 'already has frontmatter'
         return result
 
@@ -187,21 +229,21 @@ def migrate_document(filepath: Path, planning_root: Path) -> dict:
         return result
 
     # Extract metadata from content
+    content = filepath.read_text(encoding='utf-8')
     status = extract_status_from_content(content)
-    created = extract_date_from_content(content) or datetime.now().strftime('%Y-%m-%d')
+    created = extract_date_from_content(content) or today
 
     # Create frontmatter
-    frontmatter = create_frontmatter(doc_type, doc_id, status, created)
+    frontmatter = create_frontmatter(doc_type, doc_id, status, created, today)
 
     # Add addenda section if not present
-    if '\n## Addenda' not in content and '\n## Addenda\n' not in content:
+    if '\n## Addenda' not in content:
         content = content.rstrip() + '\n\n---\n\n## Addenda\n'
 
-    # Combine frontmatter and content
-    new_content = frontmatter + content
-
-    # Write back
-    filepath.write_text(new_content)
+    # Write frontmatter followed by content, without building the combined string
+    with filepath.open('wb') as f:
+        f.write(frontmatter.encode('utf-8'))
+        f.write(content.encode('utf-8'))
 
     result['status'] = 'migrated'
     result['doc_type'] = doc_type
@@ -209,23 +251,26 @@ def migrate_document(filepath: Path, planning_root: Path) -> dict:
     return result
 
 
-def find_planning_docs(planning_root: Path) -> list[Path]:
-    """Find all markdown files in planning directories."""
-    docs = []
-
+def iter_planning_docs(planning_root: Path) -> Iterator[Path]:
+    """Yield all markdown files in planning directories, in directory order."""
     if not planning_root.exists():
-        return docs
+        return
 
-    # Search all subdirectories
-    for md_file in planning_root.rglob('*.md'):
-        # Skip templates and roadmap
-        if md_file.name == 'template.md':
-            continue
-        if md_file.name == 'roadmap.md':
-            continue
-        docs.append(md_file)
+    # Walk all subdirectories using directory entry types, avoiding a stat
+    # and a Path allocation per skipped entry
+    pending = [str(planning_root)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith('.md') and entry.name not in SKIPPED_FILENAMES:
+                    yield Path(entry.path)
 
-    return sorted(docs)
+
+def find_planning_docs(planning_root: Path) -> list[Path]:
+    """Find all markdown files in planning directories, sorted by path."""
+    return sorted(iter_planning_docs(planning_root))
 
 
 def dry_run(project_dir: Path) -> list[str]:
@@ -241,9 +286,11 @@ def dry_run(project_dir: Path) -> list[str]:
 
     # Document changes
     docs = find_planning_docs(planning_root)
-    for doc in docs:
-        content = doc.read_text()
-        if not has_frontmatter(content):
+    with ThreadPoolExecutor() as executor:
+        frontmatter_flags = list(executor.map(file_has_frontmatter, docs))
+
+    for doc, has_fm in zip(docs, frontmatter_flags):
+        if not has_fm:
             doc_type = infer_doc_type(doc, planning_root)
             doc_id = extract_doc_id(doc, doc_type) if doc_type else None
             if doc_type and doc_id:
@@ -262,14 +309,24 @@ def migrate(project_dir: Path) -> bool:
     print(f"Migrating planning documents in: {planning_root}")
 
     # Migrate documents
-    docs = find_planning_docs(planning_root)
+    today = date.today().isoformat()
     migrated = 0
     skipped = 0
     errors = []
 
-    for doc in docs:
+    # Documents are independent, so overlap their file IO
+    with ThreadPoolExecutor() as executor:
+        futures = [
+            (doc, executor.submit(migrate_document, doc, planning_root, today))
+            for doc in iter_planning_docs(planning_root)
+        ]
+
+    # Report in path order, as dry_run() does
+    futures.sort(key=lambda item: item[0])
+
+    for doc, future in futures:
         try:
-            result = migrate_document(doc, planning_root)
+            result = future.result()
             if result['status'] == 'migrated':
                 print(f"  Migrated: {result.get('doc_id', doc.name)}")
                 migrated += 1
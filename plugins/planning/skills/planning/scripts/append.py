@@ -16,95 +16,12 @@ Examples:
 """
 
 import argparse
-import re
 import sys
-from datetime import date
 from pathlib import Path
 
-from config import get_project_dir, get_planning_root, get_all_types, get_type_config
-from frontmatter import (
-    parse_frontmatter,
-    render_frontmatter,
-    has_addenda_section,
-    ADDENDA_SEPARATOR,
-)
-
-
-def parse_doc_id(doc_id: str) -> tuple[str, int]:
-    """
-    Parse a document ID into type and number.
-
-    Args:
-        doc_id: Document ID like 'ADR-001', 'FDP-002', 'AP-001', 'RPT-001'
-
-    Returns:
-        Tuple of (doc_type, number)
-
-    Raises:
-        ValueError: If ID format is not recognized
-    """
-    doc_id = doc_id.upper()
-
-    patterns = [
-        (r'^ADR-(\d+)$', 'adr'),
-        (r'^FDP-(\d+)$', 'fdp'),
-        (r'^AP-(\d+)$', 'ap'),
-        (r'^RPT-(\d+)$', 'report'),
-    ]
-
-    for pattern, doc_type in patterns:
-        match = re.match(pattern, doc_id)
-        if match:
-            return doc_type, int(match.group(1))
-
-    raise ValueError(f"Unrecognized document ID format: {doc_id}")
-
-
-def find_document(doc_id: str, project_dir: Path) -> Path:
-    """
-    Find a document by its ID.
-
-    Searches both active and archive directories.
-
-    Args:
-        doc_id: Document ID like 'ADR-001'
-        project_dir: Project root directory
-
-    Returns:
-        Path to the document
-
-    Raises:
-        FileNotFoundError: If document not found
-    """
-    doc_type, number = parse_doc_id(doc_id)
-    type_config = get_type_config(doc_type)
-
-    planning_root = project_dir / get_planning_root()
-    doc_dir = planning_root / type_config['dir']
-
-    # Build filename pattern
-    prefix = type_config.get('prefix', '')
-    if prefix:
-        pattern = rf'^{re.escape(prefix)}{number:03d}-.*\.md$'
-    else:
-        pattern = rf'^{number:03d}-.*\.md$'
-
-    regex = re.compile(pattern)
-
-    # Search in main directory
-    if doc_dir.exists():
-        for f in doc_dir.iterdir():
-            if f.is_file() and regex.match(f.name):
-                return f
-
-    # Search in archive
-    archive_dir = doc_dir / 'archive'
-    if archive_dir.exists():
-        for f in archive_dir.iterdir():
-            if f.is_file() and regex.match(f.name):
-                return f
-
-    raise FileNotFoundError(f"Document not found: {doc_id}")
+from config import get_project_dir
+from frontmatter import append_addendum as add_addendum_to_content, write_atomic
+from planning_ids import find_document_by_id
 
 
 def append_addendum(filepath: Path, title: str, body: str) -> None:
@@ -116,26 +33,8 @@ def append_addendum(filepath: Path, title: str, body: str) -> None:
         title: Title for the addendum
         body: Body content for the addendum
     """
-    content = filepath.read_text()
-    today = date.today().isoformat()
-
-    # Update modified date in frontmatter if present
-    frontmatter, doc_body = parse_frontmatter(content)
-    if frontmatter:
-        frontmatter['modified'] = today
-        content = render_frontmatter(frontmatter) + doc_body
-
-    # Format the addendum entry
-    addendum_entry = f"\n### {today}: {title}\n\n{body}\n"
-
-    if has_addenda_section(content):
-        # Append to existing addenda section
-        new_content = content.rstrip() + addendum_entry
-    else:
-        # Create addenda section
-        new_content = content.rstrip() + ADDENDA_SEPARATOR + addendum_entry.lstrip('\n')
-
-    filepath.write_text(new_content)
+    content = add_addendum_to_content(filepath.read_text(encoding='utf-8'), title, body)
+    write_atomic(filepath, content)
 
 
 def main():
@@ -165,7 +64,7 @@ def main():
     args = parser.parse_args()
 
     try:
-        filepath = find_document(args.doc_id, args.project_dir)
+        filepath = find_document_by_id(args.doc_id, args.project_dir)
 
         # Use placeholder if no body provided
         body = args.body if args.body else '[Add details here]'
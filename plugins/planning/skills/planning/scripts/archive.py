@@ -19,77 +19,23 @@ This will:
 
 import argparse
 import re
-import shutil
 import sys
-from datetime import date
 from pathlib import Path
 
 from config import (
     get_project_dir,
-    get_planning_root,
-    get_type_config,
+    get_today,
 )
-from frontmatter import parse_frontmatter, render_frontmatter
+from frontmatter import parse_frontmatter, render_frontmatter, find_status_value, write_atomic
+from planning_ids import parse_doc_id, find_document
 
-
-def parse_doc_id(doc_id: str) -> tuple[str, int]:
-    """
-    Parse a document ID into type and number.
-
-    Args:
-        doc_id: Document ID like 'ADR-001', 'FDP-002', 'AP-001', 'RPT-001'
-
-    Returns:
-        Tuple of (doc_type, number)
-
-    Raises:
-        ValueError: If ID format is not recognized
-    """
-    doc_id = doc_id.upper()
-
-    patterns = [
-        (r'^ADR-(\d+)$', 'adr'),
-        (r'^FDP-(\d+)$', 'fdp'),
-        (r'^AP-(\d+)$', 'ap'),
-        (r'^RPT-(\d+)$', 'report'),
-    ]
-
-    for pattern, doc_type in patterns:
-        match = re.match(pattern, doc_id)
-        if match:
-            return doc_type, int(match.group(1))
-
-    raise ValueError(f"Invalid document ID: {doc_id}. Expected format: ADR-001, FDP-002, AP-003, or RPT-001")
-
-
-def find_document(doc_type: str, number: int, project_dir: Path) -> Path | None:
-    """Find a document by type and number (not in archive)."""
-    type_config = get_type_config(doc_type)
-    planning_root = project_dir / get_planning_root()
-    doc_dir = planning_root / type_config['dir']
-
-    if not doc_dir.exists():
-        return None
-
-    # Build pattern based on type config
-    prefix = type_config.get('prefix', '')
-    if prefix:
-        pattern = re.compile(rf'^{re.escape(prefix)}(\d+)-.*\.md$')
-    else:
-        pattern = re.compile(r'^(\d+)-.*\.md$')
-
-    for f in doc_dir.iterdir():
-        if f.is_file():
-            match = pattern.match(f.name)
-            if match and int(match.group(1)) == number:
-                return f
-
-    return None
+# Body status section: header, current value, and line ending
+STATUS_SECTION_PATTERN = re.compile(r'(## Status\s*\n\s*\n?)([^\n#]+)(\n?)')
 
 
 def update_status_in_content(content: str, new_status: str = "Archived") -> str:
     """Update status in both frontmatter and body."""
-    today = date.today().isoformat()
+    today = get_today()
 
     # Parse frontmatter
     frontmatter, body = parse_frontmatter(content)
@@ -100,26 +46,34 @@ def update_status_in_content(content: str, new_status: str = "Archived") -> str:
         frontmatter['modified'] = today
         content = render_frontmatter(frontmatter) + body
 
-    # Update body status section
-    status_pattern = r'(## Status\s*\n\s*\n?)([^\n#]+)'
-
-    def replace_status(match):
-        prefix = match.group(1)
-        return f"{prefix}{new_status}"
+    # Locate a single body status value by string scan when the layout allows
+    span = find_status_value(content)
+    if span is None:
+        # Otherwise replace every Status section, adding the Archived
+        # section after the first one
+        archived = '## Archived' in content
 
-    content, count = re.subn(status_pattern, replace_status, content)
+        def replace_section(match: re.Match) -> str:
+            nonlocal archived
+            header, _, line_end = match.groups()
+            section = f"{header}{new_status}{line_end}"
+            if line_end and not archived:
+                section += f"\n## Archived\n\n{today}\n"
+                archived = True
+            return section
 
-    # Add Archived date section if not present
-    if '## Archived' not in content:
-        archived_section = f"\n## Archived\n\n{today}\n"
+        return STATUS_SECTION_PATTERN.sub(replace_section, content)
+    start, end = span
 
-        # Find position after Status section
-        status_match = re.search(r'## Status\s*\n\s*\n?[^\n#]+\n', content)
-        if status_match:
-            insert_pos = status_match.end()
-            content = content[:insert_pos] + archived_section + content[insert_pos:]
+    # Replace it and add an Archived date section after its line
+    section = new_status
+    if content.startswith('\n', end):
+        end += 1
+        section += '\n'
+        if '## Archived' not in content:
+            section += f"\n## Archived\n\n{today}\n"
 
-    return content
+    return content[:start] + section + content[end:]
 
 
 def archive_document(doc_id: str, project_dir: Path) -> Path:
@@ -127,18 +81,18 @@ def archive_document(doc_id: str, project_dir: Path) -> Path:
     doc_type, number = parse_doc_id(doc_id)
 
     # Find the document
-    filepath = find_document(doc_type, number, project_dir)
+    filepath, in_archive = find_document(doc_type, number, project_dir)
     if not filepath:
         raise FileNotFoundError(f"Document not found: {doc_id}")
 
     # Check if already archived
-    if 'archive' in filepath.parts:
+    if in_archive:
         raise ValueError(f"Document is already archived: {filepath}")
 
     # Update status
-    content = filepath.read_text()
+    content = filepath.read_text(encoding='utf-8')
     new_content = update_status_in_content(content)
-    filepath.write_text(new_content)
+    write_atomic(filepath, new_content)
 
     # Create archive directory
     archive_dir = filepath.parent / 'archive'
@@ -149,7 +103,8 @@ def archive_document(doc_id: str, project_dir: Path) -> Path:
     if new_path.exists():
         raise FileExistsError(f"Archive destination already exists: {new_path}")
 
-    shutil.move(str(filepath), str(new_path))
+    # Archive directory is always a sibling, so this is a same-filesystem rename
+    filepath.rename(new_path)
 
     return new_path
 
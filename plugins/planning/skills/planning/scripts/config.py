@@ -4,10 +4,12 @@ Shared configuration for planning scripts.
 Reads planning configuration from vibe-hacker.json.
 """
 
+import functools
 import json
 import os
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 # Current schema version
 CURRENT_VERSION = '0.2.0'
@@ -74,34 +76,120 @@ DEFAULT_TYPES = {
         }
     }
 }
+# Shared read-only views of the defaults, returned when no override applies
+FROZEN_TYPES = {k: MappingProxyType(v) for k, v in DEFAULT_TYPES.items()}
+EMPTY_TYPE = MappingProxyType({})
+
+# Status lookups per type; statuses are not configurable, so these are
+# built once from the defaults
+STATUS_SETS = {
+    type_key: {
+        bucket: frozenset(s.lower() for s in type_config['statuses'][bucket])
+        for bucket in ('editable', 'final', 'archive_triggers')
+    }
+    for type_key, type_config in DEFAULT_TYPES.items()
+}
+VALID_STATUSES = {
+    type_key: tuple(sorted({
+        type_config['statuses']['initial'],
+        *type_config['statuses']['editable'],
+        *type_config['statuses']['final'],
+        *type_config['statuses']['archive_triggers'],
+    } - {''}))
+    for type_key, type_config in DEFAULT_TYPES.items()
+}
+for type_key, statuses in VALID_STATUSES.items():
+    STATUS_SETS[type_key]['valid'] = frozenset(s.lower() for s in statuses)
+
+# Parsed configs by path, with the (st_mtime_ns, st_size) they were read at
+_config_cache: dict[Path, tuple[tuple[int, int], dict]] = {}
 
 
+@functools.cache
 def get_project_dir() -> Path:
-    """Get the project directory."""
+    """Get the project directory (resolved once per process)."""
     return Path(os.environ.get('CLAUDE_PROJECT_DIR', '.'))
 
 
+@functools.cache
+def get_today() -> str:
+    """
+    Get today's date as YYYY-MM-DD (resolved once per process).
+
+    Scripts are short-lived, so every date a run writes is the same; a
+    long-running caller would need get_today.cache_clear() at midnight.
+    """
+    # Only needed by scripts that write documents, so not imported up front
+    from datetime import date
+
+    return date.today().isoformat()
+
+
+@functools.cache
 def get_config_path() -> Path:
     """Get path to vibe-hacker.json config file."""
     return get_project_dir() / '.claude' / 'vibe-hacker.json'
 
 
+@functools.lru_cache(maxsize=None)
+def get_json_loads():
+    """
+    Get the JSON parser for config files, importing it on first use.
+
+    orjson is preferred when installed; it pulls in datetime, uuid and more,
+    so scripts that never read a config skip the cost.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+
 def load_config() -> dict:
-    """Load configuration from vibe-hacker.json."""
+    """
+    Load configuration from vibe-hacker.json.
+
+    Parsed configs are cached per path and reused while the file's
+    modification time and size are unchanged.
+    """
     config_path = get_config_path()
-    if config_path.exists():
-        try:
-            return json.loads(config_path.read_text())
-        except (json.JSONDecodeError, IOError):
-            return {}
-    return {}
+    try:
+        stat = config_path.stat()
+    except OSError:
+        return {}
+
+    file_key = (stat.st_mtime_ns, stat.st_size)
+    cached = _config_cache.get(config_path)
+    if cached and cached[0] == file_key:
+        return cached[1]
+
+    try:
+        data = config_path.read_bytes()
+        config = get_json_loads()(data)
+    except (json.JSONDecodeError, IOError):
+        config = {}
+
+    _config_cache[config_path] = (file_key, config)
+    return config
+
+
+def clear_config_cache() -> None:
+    """Drop all cached configs so the next load re-reads the file."""
+    _config_cache.clear()
 
 
 def save_config(config: dict) -> None:
     """Save configuration to vibe-hacker.json."""
     config_path = get_config_path()
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(json.dumps(config, indent=2) + '\n')
+    content = json.dumps(config, indent=2) + '\n'
+    try:
+        if config_path.read_text() == content:
+            return
+    except OSError:
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+    config_path.write_text(content)
+    clear_config_cache()
 
 
 def get_planning_version() -> str:
@@ -127,7 +215,36 @@ def get_planning_root() -> str:
     return DEFAULT_PLANNING_ROOT
 
 
-def get_type_config(doc_type: str) -> dict:
+def get_subdirs_override() -> dict:
+    """Get the configured planning.subdirs overrides."""
+    config = load_config()
+    return config.get('planning', {}).get('subdirs', {})
+
+
+def resolve_type_config(doc_type: str, subdirs: dict) -> Mapping:
+    """Apply a subdirs override to a type's defaults, copying only if it differs."""
+    default = FROZEN_TYPES.get(doc_type, EMPTY_TYPE)
+    if doc_type in subdirs and subdirs[doc_type] != default.get('dir'):
+        return MappingProxyType({**default, 'dir': subdirs[doc_type]})
+    return default
+
+
+@functools.lru_cache(maxsize=8)
+def resolve_all_types(subdirs: tuple[tuple[str, str], ...]) -> Mapping:
+    """Resolve every type's configuration for one set of subdirs overrides."""
+    overrides = dict(subdirs)
+    return MappingProxyType({
+        type_key: resolve_type_config(type_key, overrides) for type_key in DEFAULT_TYPES
+    })
+
+
+def get_resolved_types() -> Mapping:
+    """Get the resolved type configurations for the current config (cached)."""
+    subdirs = get_subdirs_override()
+    return resolve_all_types(tuple(sorted(subdirs.items())))
+
+
+def get_type_config(doc_type: str) -> Mapping:
     """
     Get the full configuration for a document type.
 
@@ -135,41 +252,23 @@ def get_type_config(doc_type: str) -> dict:
         doc_type: Document type key (adr, fdp, ap, report)
 
     Returns:
-        Type configuration dictionary
+        Read-only type configuration mapping
     """
-    config = load_config()
-    planning_config = config.get('planning', {})
-    subdirs = planning_config.get('subdirs', {})
-
-    default = DEFAULT_TYPES.get(doc_type, {}).copy()
+    type_config = get_resolved_types().get(doc_type)
+    if type_config is None:
+        return resolve_type_config(doc_type, get_subdirs_override())
+    return type_config
 
-    # Override dir from subdirs config if present
-    if doc_type in subdirs:
-        default['dir'] = subdirs[doc_type]
 
-    return default
-
-
-def get_all_types() -> dict:
+def get_all_types() -> Mapping:
     """
     Get configuration for all document types.
 
     Returns:
-        Dictionary mapping type keys to their configurations
+        Read-only mapping of type keys to their configurations, shared
+        between calls for the same config
     """
-    config = load_config()
-    planning_config = config.get('planning', {})
-    subdirs = planning_config.get('subdirs', {})
-
-    # Start with defaults
-    types = {k: v.copy() for k, v in DEFAULT_TYPES.items()}
-
-    # Apply subdirs overrides
-    for type_key, subdir in subdirs.items():
-        if type_key in types:
-            types[type_key]['dir'] = subdir
-
-    return types
+    return get_resolved_types()
 
 
 def get_doc_dir(doc_type: str) -> str:
@@ -191,15 +290,12 @@ def is_status_editable(doc_type: str, status: str) -> bool:
 
     Args:
         doc_type: Document type key
-        status: Current status (case-insensitive)
+        status: Current status, normalized to lowercase
 
     Returns:
         True if document can be edited
     """
-    type_config = get_type_config(doc_type)
-    statuses = type_config.get('statuses', {})
-    editable = statuses.get('editable', [])
-    return status.lower() in [s.lower() for s in editable]
+    return status in STATUS_SETS.get(doc_type, {}).get('editable', ())
 
 
 def is_archive_trigger(doc_type: str, status: str) -> bool:
@@ -208,15 +304,26 @@ def is_archive_trigger(doc_type: str, status: str) -> bool:
 
     Args:
         doc_type: Document type key
-        status: Current status (case-insensitive)
+        status: Current status, normalized to lowercase
 
     Returns:
         True if status suggests archiving
     """
-    type_config = get_type_config(doc_type)
-    statuses = type_config.get('statuses', {})
-    triggers = statuses.get('archive_triggers', [])
-    return status.lower() in [s.lower() for s in triggers]
+    return status in STATUS_SETS.get(doc_type, {}).get('archive_triggers', ())
+
+
+def is_valid_status(doc_type: str, status: str) -> bool:
+    """
+    Check if a status is valid for a document type.
+
+    Args:
+        doc_type: Document type key
+        status: Status to check, normalized to lowercase
+
+    Returns:
+        True if the type accepts the status
+    """
+    return status in STATUS_SETS.get(doc_type, {}).get('valid', ())
 
 
 def get_valid_statuses(doc_type: str) -> list:
@@ -229,17 +336,7 @@ def get_valid_statuses(doc_type: str) -> list:
     Returns:
         List of valid status strings
     """
-    type_config = get_type_config(doc_type)
-    statuses = type_config.get('statuses', {})
-
-    all_statuses = set()
-    all_statuses.add(statuses.get('initial', ''))
-    all_statuses.update(statuses.get('editable', []))
-    all_statuses.update(statuses.get('final', []))
-    all_statuses.update(statuses.get('archive_triggers', []))
-    all_statuses.discard('')
-
-    return sorted(all_statuses)
+    return list(VALID_STATUSES.get(doc_type, ()))
 
 
 def format_doc_id(doc_type: str, number: int) -> str:
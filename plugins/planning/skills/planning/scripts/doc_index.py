@@ -0,0 +1,223 @@
+"""
+Metadata index for planning documents.
+
+Caches each document's display status and title in
+<project>/.claude/cache/planning-index.json so listings don't have to open and
+parse every document. Entries are keyed by path relative to the project and
+stamped with the file's mtime and size; a stale or missing entry is simply
+re-extracted from the document. The index is only written into an existing
+.claude directory, and its cache directory carries its own .gitignore, so it
+never shows up in the project's version control.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from frontmatter import (
+    read_doc,
+    extract_status_from_body,
+    FRONTMATTER_OPEN,
+    PLAIN_SCALAR_PATTERN,
+    TITLE_PATTERN,
+    YAML_KEYWORDS,
+)
+
+INDEX_DIR = Path('.claude') / 'cache'
+INDEX_FILENAME = 'planning-index.json'
+
+
+def extract_status(frontmatter: dict, content: str) -> str:
+    """Extract status from a parsed document (frontmatter or body)."""
+    # Try frontmatter first
+    if 'status' in frontmatter:
+        status = frontmatter['status']
+        # Capitalize for display
+        return status.title() if isinstance(status, str) else str(status)
+
+    # Fallback to body parsing
+    status = extract_status_from_body(content)
+    if status:
+        return status
+
+    return 'Unknown'
+
+
+def status_matches(status: str, status_filter: str | None) -> bool:
+    """Check a display status against an optional (case-insensitive) filter."""
+    return not status_filter or status.lower() == status_filter.lower()
+
+
+def scan_head(filepath: Path, status_filter: str | None = None) -> tuple[str, str | None] | None:
+    """
+    Scan a document line by line for its frontmatter status and H1 title.
+
+    Reading stops at the title, so the rest of the body is never loaded;
+    if the status is rejected by status_filter it stops before the title.
+
+    Returns:
+        Tuple of (status, title), with title None if the status was filtered
+        out, or None if the document has no plain frontmatter status or no
+        non-empty title (callers fall back to a full parse)
+    """
+    status = None
+    with open(filepath, encoding='utf-8') as f:
+        if f.readline() != FRONTMATTER_OPEN:
+            return None
+
+        for line in f:
+            if line == '---\n':
+                break
+            if line.startswith('status:'):
+                value = line[len('status:'):].strip()
+                # Quoted values, comments, booleans, nulls and the like are
+                # left to the YAML parser
+                if not PLAIN_SCALAR_PATTERN.fullmatch(value) or value.lower() in YAML_KEYWORDS:
+                    return None
+                status = extract_status({'status': value}, '')
+        else:
+            return None
+
+        if status is None:
+            return None
+        if not status_matches(status, status_filter):
+            return status, None
+
+        for line in f:
+            # Like TITLE_PATTERN.search(), skip '# ' lines with nothing after them
+            match = line.startswith('# ') and TITLE_PATTERN.match(line.rstrip('\r\n'))
+            if match:
+                title = match.group(1).strip()
+                return (status, title) if title else None
+
+    return None
+
+
+def extract_metadata(filepath: Path, status_filter: str | None = None) -> tuple[str, str | None]:
+    """
+    Extract status and title from a document.
+
+    The common case is answered by scan_head() without a YAML parse; other
+    documents are read once and parsed in full.
+
+    Returns:
+        Tuple of (status, title); title is None (not extracted) when the
+        status is rejected by status_filter
+    """
+    metadata = scan_head(filepath, status_filter)
+    if metadata:
+        return metadata
+
+    doc = read_doc(filepath)
+    status = extract_status(doc.frontmatter, doc.body)
+    if not status_matches(status, status_filter):
+        return status, None
+
+    return status, doc.title or filepath.stem
+
+
+def is_valid_entry(entry) -> bool:
+    """Check that an index entry has the shape get_metadata() stores."""
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get('stamp'), list)
+        and isinstance(entry.get('status'), str)
+        and isinstance(entry.get('title', 0), (str, type(None)))
+    )
+
+
+def load_index(project_dir: Path) -> dict:
+    """
+    Load the metadata index, or an empty one if missing or unreadable.
+
+    Malformed entries (e.g. from a hand-edited file) are dropped, so their
+    documents are re-extracted.
+    """
+    try:
+        index = json.loads((project_dir / INDEX_DIR / INDEX_FILENAME).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(index, dict):
+        return {}
+    return {key: entry for key, entry in index.items() if is_valid_entry(entry)}
+
+
+def save_index(project_dir: Path, index: dict) -> None:
+    """
+    Write the metadata index atomically (concurrent writers: last one wins).
+
+    Nothing is written unless the project already has a .claude directory,
+    so listing a project never creates one.
+    """
+    index_dir = project_dir / INDEX_DIR
+    if not index_dir.parent.is_dir():
+        return
+    index_path = index_dir / INDEX_FILENAME
+    tmp_path = index_path.with_name(f'{INDEX_FILENAME}.{os.getpid()}.tmp')
+    try:
+        index_dir.mkdir(exist_ok=True)
+        gitignore = index_dir / '.gitignore'
+        if not gitignore.exists():
+            gitignore.write_text('# Created by the planning scripts\n*\n')
+        tmp_path.write_text(json.dumps(index, separators=(',', ':'), sort_keys=True))
+        os.replace(tmp_path, index_path)
+    except OSError:
+        # The index is only a cache; failing to write it is not an error
+        tmp_path.unlink(missing_ok=True)
+
+
+def get_metadata(
+    index: dict,
+    key: str,
+    filepath: Path,
+    status_filter: str | None = None,
+) -> tuple[str, str | None, bool]:
+    """
+    Get a document's status and title, from the index when it is current.
+
+    Stale or missing entries are re-extracted and stored back into the index.
+    Entries whose title was skipped by a status filter count as stale for
+    lookups that need the title. A document that cannot be read or parsed is
+    reported with status 'Error' and is not stored.
+
+    Args:
+        index: Index loaded with load_index()
+        key: Document path relative to the project, '/'-separated
+        filepath: Path to the document
+        status_filter: If given, skip the title of documents with another status
+
+    Returns:
+        Tuple of (status, title, index_changed); title is None if filtered out
+    """
+    st = filepath.stat()
+    stamp = [st.st_mtime_ns, st.st_size]
+
+    entry = index.get(key)
+    if entry and entry.get('stamp') == stamp:
+        if entry['title'] is not None or not status_matches(entry['status'], status_filter):
+            return entry['status'], entry['title'], False
+
+    try:
+        status, title = extract_metadata(filepath, status_filter)
+    except Exception:
+        return 'Error', filepath.stem if status_matches('Error', status_filter) else None, False
+
+    index[key] = {'stamp': stamp, 'status': status, 'title': title}
+    return status, title, True
+
+
+def index_documents(project_dir: Path, filepaths) -> None:
+    """Refresh the entries of documents that have been created or modified."""
+    index = load_index(project_dir)
+    index_changed = False
+
+    for filepath in filepaths:
+        try:
+            key = filepath.relative_to(project_dir).as_posix()
+        except ValueError:
+            continue
+        _, _, changed = get_metadata(index, key, filepath)
+        index_changed |= changed
+
+    if index_changed:
+        save_index(project_dir, index)
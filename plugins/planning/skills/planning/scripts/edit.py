@@ -20,135 +20,72 @@ Exit codes:
 """
 
 import argparse
-import re
 import sys
 from pathlib import Path
 
 from config import (
     get_project_dir,
-    get_planning_root,
-    get_all_types,
-    get_type_config,
     is_status_editable,
 )
-from frontmatter import parse_frontmatter, extract_status_from_body
-
-
-def parse_doc_id(doc_id: str) -> tuple[str, int]:
-    """
-    Parse a document ID into type and number.
-
-    Args:
-        doc_id: Document ID like 'ADR-001', 'FDP-002', 'AP-001', 'RPT-001'
-
-    Returns:
-        Tuple of (doc_type, number)
-
-    Raises:
-        ValueError: If ID format is not recognized
-    """
-    doc_id = doc_id.upper()
-
-    patterns = [
-        (r'^ADR-(\d+)$', 'adr'),
-        (r'^FDP-(\d+)$', 'fdp'),
-        (r'^AP-(\d+)$', 'ap'),
-        (r'^RPT-(\d+)$', 'report'),
-    ]
-
-    for pattern, doc_type in patterns:
-        match = re.match(pattern, doc_id)
-        if match:
-            return doc_type, int(match.group(1))
-
-    raise ValueError(f"Invalid document ID: {doc_id}. Expected format: ADR-001, FDP-002, AP-003, or RPT-001")
-
-
-def find_document(doc_type: str, number: int, project_dir: Path, include_archive: bool = True) -> Path | None:
-    """Find a document by type and number."""
-    type_config = get_type_config(doc_type)
-    planning_root = project_dir / get_planning_root()
-    doc_dir = planning_root / type_config['dir']
-
-    if not doc_dir.exists():
-        return None
-
-    # Build pattern based on type config
-    prefix = type_config.get('prefix', '')
-    if prefix:
-        pattern = re.compile(rf'^{re.escape(prefix)}(\d+)-.*\.md$')
-    else:
-        pattern = re.compile(r'^(\d+)-.*\.md$')
-
-    # Check main directory first
-    for f in doc_dir.iterdir():
-        if f.is_file():
-            match = pattern.match(f.name)
-            if match and int(match.group(1)) == number:
-                return f
-
-    # Check archive if requested
-    if include_archive:
-        archive_dir = doc_dir / 'archive'
-        if archive_dir.exists():
-            for f in archive_dir.iterdir():
-                if f.is_file():
-                    match = pattern.match(f.name)
-                    if match and int(match.group(1)) == number:
-                        return f
-
-    return None
+from frontmatter import (
+    read_head,
+    parse_frontmatter,
+    extract_status_from_body,
+    find_frontmatter_end,
+    FRONTMATTER_OPEN,
+)
+from planning_ids import parse_doc_id, find_document
+
+# How to proceed with a locked document, by type and normalized status
+UNLOCK_INSTRUCTIONS = {
+    'adr': {
+        'accepted': "To modify an accepted ADR, create a new ADR that supersedes it, or add an addendum.",
+        'deprecated': "Deprecated ADRs are read-only. Create a new ADR or add an addendum.",
+        'superseded': "Superseded ADRs are read-only. Edit the superseding ADR or add an addendum.",
+    },
+    'fdp': {
+        'implemented': "Implemented FDPs are read-only. Create a new FDP or add an addendum.",
+        'abandoned': "Abandoned FDPs are read-only. Create a new FDP to revisit.",
+    },
+    'ap': {
+        'completed': "Completed action plans are read-only. Create a new AP for follow-up work.",
+        'abandoned': "Abandoned action plans are read-only. Create a new AP to revisit.",
+    },
+    'report': {
+        'published': "Published reports are read-only. Create a new report or add an addendum.",
+        'superseded': "Superseded reports are read-only. Add an addendum if needed.",
+        'obsoleted': "Obsoleted reports are read-only.",
+    },
+}
 
 
 def extract_status(filepath: Path) -> str:
-    """Extract current status from a document (frontmatter or body)."""
-    content = filepath.read_text()
+    """Extract current normalized status from a document (frontmatter or body)."""
+    # Both sources are normally near the top, so read only that much first
+    head, complete = read_head(filepath)
+    if not complete and head.startswith(FRONTMATTER_OPEN) and find_frontmatter_end(head) < 0:
+        # Frontmatter runs past the head
+        head, complete = filepath.read_text(encoding='utf-8'), True
 
     # Try frontmatter first
-    frontmatter, body = parse_frontmatter(content)
-    if frontmatter and 'status' in frontmatter:
-        return frontmatter['status']
-
-    # Fallback to body parsing
-    status = extract_status_from_body(content)
+    frontmatter, _ = parse_frontmatter(head)
+    if 'status' in frontmatter:
+        return frontmatter['status'].strip().lower()
+
+    # Fallback to body parsing, reading the whole file only if needed
+    status = extract_status_from_body(head)
+    if not status and not complete:
+        status = extract_status_from_body(filepath.read_text(encoding='utf-8'))
     if status:
-        return status
+        return status.strip().lower()
 
-    return 'Unknown'
-
-
-def is_archived(filepath: Path) -> bool:
-    """Check if document is in archive directory."""
-    return 'archive' in filepath.parts
+    return 'unknown'
 
 
 def get_unlock_instruction(doc_type: str, status: str) -> str:
-    """Get instruction for how to modify a locked document."""
-    status_lower = status.lower()
-
-    instructions = {
-        'adr': {
-            'accepted': "To modify an accepted ADR, create a new ADR that supersedes it, or add an addendum.",
-            'deprecated': "Deprecated ADRs are read-only. Create a new ADR or add an addendum.",
-            'superseded': "Superseded ADRs are read-only. Edit the superseding ADR or add an addendum.",
-        },
-        'fdp': {
-            'implemented': "Implemented FDPs are read-only. Create a new FDP or add an addendum.",
-            'abandoned': "Abandoned FDPs are read-only. Create a new FDP to revisit.",
-        },
-        'ap': {
-            'completed': "Completed action plans are read-only. Create a new AP for follow-up work.",
-            'abandoned': "Abandoned action plans are read-only. Create a new AP to revisit.",
-        },
-        'report': {
-            'published': "Published reports are read-only. Create a new report or add an addendum.",
-            'superseded': "Superseded reports are read-only. Add an addendum if needed.",
-            'obsoleted': "Obsoleted reports are read-only.",
-        },
-    }
-
-    type_instructions = instructions.get(doc_type, {})
-    return type_instructions.get(status_lower, f"Document with status '{status}' is locked.")
+    """Get instruction for how to modify a locked document (status normalized)."""
+    type_instructions = UNLOCK_INSTRUCTIONS.get(doc_type, {})
+    return type_instructions.get(status, f"Document with status '{status}' is locked.")
 
 
 def check_editable(doc_type: str, status: str, is_in_archive: bool) -> tuple[bool, str | None]:
@@ -167,38 +104,35 @@ def check_editable(doc_type: str, status: str, is_in_archive: bool) -> tuple[boo
     return False, get_unlock_instruction(doc_type, status)
 
 
-def check_document_editable(doc_id: str, project_dir: Path, force: bool = False) -> tuple[Path, bool, str | None]:
+def check_document_editable(doc_id: str, project_dir: Path, force: bool = False) -> tuple[Path, bool, str | None, str]:
     """
     Check if a document can be edited.
 
     Returns:
-        tuple of (filepath, is_editable, message)
+        tuple of (filepath, is_editable, message, status)
     """
     doc_type, number = parse_doc_id(doc_id)
 
     # Find the document
-    filepath = find_document(doc_type, number, project_dir)
+    filepath, in_archive = find_document(doc_type, number, project_dir)
     if not filepath:
         raise FileNotFoundError(f"Document not found: {doc_id}")
 
     # Get status and check if editable
     status = extract_status(filepath)
-    in_archive = is_archived(filepath)
 
     is_editable, reason = check_editable(doc_type, status, in_archive)
 
     if not is_editable and force:
-        return filepath, True, f"WARNING: Forcing edit of locked document. {reason}"
+        return filepath, True, f"WARNING: Forcing edit of locked document. {reason}", status
 
     if not is_editable:
-        return filepath, False, reason
+        return filepath, False, reason, status
 
-    return filepath, True, None
+    return filepath, True, None, status
 
 
 def main():
-    all_types = get_all_types()
-
     parser = argparse.ArgumentParser(
         description='Check if a planning document can be edited and output its path.'
     )
@@ -226,7 +160,7 @@ def main():
     args = parser.parse_args()
 
     try:
-        filepath, is_editable, message = check_document_editable(
+        filepath, is_editable, message, status = check_document_editable(
             args.doc_id, args.project_dir, args.force
         )
 
@@ -238,7 +172,7 @@ def main():
         else:
             if not args.quiet:
                 print(f"Error: Cannot edit {args.doc_id}", file=sys.stderr)
-                print(f"Status: {extract_status(filepath)}", file=sys.stderr)
+                print(f"Status: {status}", file=sys.stderr)
                 if message:
                     print(f"\n{message}", file=sys.stderr)
                 print(f"\nTip: Use 'append.py {args.doc_id} \"<title>\"' to add an addendum instead.", file=sys.stderr)
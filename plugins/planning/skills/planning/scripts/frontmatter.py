@@ -5,24 +5,101 @@ Provides functions to parse YAML frontmatter from markdown documents
 and render frontmatter back to YAML format.
 """
 
+import functools
+import os
 import re
-from datetime import datetime
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
-# Try to import yaml, fall back to basic parsing if not available
-try:
-    import yaml
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
+from config import get_today
 
 # Frontmatter delimiters
-FRONTMATTER_PATTERN = re.compile(r'^---\n(.*?)\n---\n', re.DOTALL)
+FRONTMATTER_OPEN = '---\n'
+FRONTMATTER_CLOSE = '\n---\n'
+
+# Characters read_head() reads, enough for the frontmatter of most documents
+HEAD_READ_LIMIT = 16 * 1024
 
 # Addenda section markers
 ADDENDA_SEPARATOR = "\n\n---\n\n## Addenda\n"
 ADDENDA_PATTERN = re.compile(r'\n---\n\n## Addenda\n', re.IGNORECASE)
 
+# Body sections of documents without (or predating) frontmatter
+STATUS_HEADING = '## Status'
+STATUS_VALUE_PATTERN = re.compile(r'(## Status\s*\n\s*\n?)([^\n#]+)')
+TITLE_PATTERN = re.compile(r'^# (?:(?:ADR|FDP|AP|RPT)-\d+:\s*)?(.+)$', re.MULTILINE)
+DATE_SECTION_PATTERN = re.compile(r'^## (?:Date|Created)\s*\n+(\d{4}-\d{2}-\d{2})', re.MULTILINE)
+BODY_SCAN_WINDOW = 4096
+
+# Top-level "key: value" lines, used when PyYAML is unavailable
+FRONTMATTER_KV_PATTERN = re.compile(r'^([A-Za-z_][\w-]*):[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+NULL_VALUES = frozenset(('null', 'Null', 'NULL', '~', ''))
+
+# Strings YAML reads back as plain strings when left unquoted
+PLAIN_SCALAR_PATTERN = re.compile(r'[A-Za-z][\w./-]*(?: [\w./-]+)*')
+YAML_KEYWORDS = frozenset(('true', 'false', 'yes', 'no', 'on', 'off', 'y', 'n', 'null'))
+
+
+@functools.lru_cache(maxsize=None)
+def get_yaml():
+    """
+    Import PyYAML on first use, so scripts that never touch YAML skip the cost.
+
+    Returns:
+        Tuple of (yaml_module, loader_class, dumper_class), preferring the
+        libyaml C bindings, or None if PyYAML is not installed (callers fall
+        back to basic parsing)
+    """
+    try:
+        import yaml
+    except ImportError:
+        return None
+
+    try:
+        from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeLoader as Loader, SafeDumper as Dumper
+
+    return yaml, Loader, Dumper
+
+
+def find_frontmatter_end(content: str) -> int:
+    """
+    Find the closing frontmatter delimiter.
+
+    Args:
+        content: Full document content
+
+    Returns:
+        Index of the closing delimiter, or -1 if there is no frontmatter
+    """
+    if not content.startswith(FRONTMATTER_OPEN):
+        return -1
+    return content.find(FRONTMATTER_CLOSE, len(FRONTMATTER_OPEN))
+
+
+def parse_scalar(value: str):
+    """
+    Convert a raw frontmatter value to None, a list or an unquoted string.
+
+    Args:
+        value: Value text with surrounding whitespace already removed
+
+    Returns:
+        Parsed value
+    """
+    if value in NULL_VALUES:
+        return None
+    first, last = value[0], value[-1]
+    if first == '[' and last == ']':
+        return [item.strip().strip('"\'') for item in value[1:-1].split(',') if item.strip()]
+    if first == last and first in '"\'' and len(value) > 1:
+        return value[1:-1]
+    return value
+
 
 def parse_frontmatter(content: str) -> tuple[dict, str]:
     """
@@ -35,43 +112,74 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
         Tuple of (frontmatter_dict, body_content)
         Returns ({}, content) if no frontmatter found
     """
-    match = FRONTMATTER_PATTERN.match(content)
-    if not match:
+    end = find_frontmatter_end(content)
+    if end < 0:
         return {}, content
 
-    frontmatter_text = match.group(1)
-    body = content[match.end():]
+    frontmatter_text = content[len(FRONTMATTER_OPEN):end]
+    body = content[end + len(FRONTMATTER_CLOSE):]
 
-    if HAS_YAML:
+    yaml_support = get_yaml()
+    if yaml_support:
+        yaml, loader, _ = yaml_support
         try:
-            frontmatter = yaml.safe_load(frontmatter_text)
+            frontmatter = yaml.load(frontmatter_text, Loader=loader)
             return frontmatter or {}, body
         except yaml.YAMLError:
             return {}, content
     else:
         # Basic fallback parsing for simple key: value pairs
-        frontmatter = {}
-        for line in frontmatter_text.split('\n'):
-            if ':' in line:
-                key, _, value = line.partition(':')
-                key = key.strip()
-                value = value.strip()
-                # Handle null/empty values
-                if value.lower() in ('null', '~', ''):
-                    value = None
-                # Handle lists (basic)
-                elif value.startswith('[') and value.endswith(']'):
-                    items = value[1:-1].split(',')
-                    value = [item.strip().strip('"\'') for item in items if item.strip()]
-                # Strip quotes
-                elif value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-                frontmatter[key] = value
+        frontmatter = {
+            match.group(1): parse_scalar(match.group(2))
+            for match in FRONTMATTER_KV_PATTERN.finditer(frontmatter_text)
+        }
         return frontmatter, body
 
 
+def read_head(filepath: Path) -> tuple[str, bool]:
+    """
+    Read the top of a document without reading the rest of the file.
+
+    At most HEAD_READ_LIMIT characters are read; callers that find the head
+    incomplete read the whole file. The file is read in text mode, so CRLF
+    line endings come back as '\n' like read_text().
+
+    Args:
+        filepath: Path to the document
+
+    Returns:
+        Tuple of (text, complete). complete is True if the whole file was
+        read; otherwise text is cut at the last full line.
+    """
+    with open(filepath, encoding='utf-8') as f:
+        head = f.read(HEAD_READ_LIMIT)
+    if len(head) < HEAD_READ_LIMIT:
+        return head, True
+    return head[:head.rfind('\n') + 1], False
+
+
+def write_atomic(filepath: Path, content: str) -> None:
+    """
+    Replace a file's content atomically, so it is never left half-written.
+
+    The content is written to a temp file beside the real file (symlinks are
+    followed, so a linked document is updated in place), given the original
+    file's mode, and then renamed over it.
+    """
+    target = os.path.realpath(filepath)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f'.{os.path.basename(target)}.', suffix='.tmp', dir=os.path.dirname(target)
+    )
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
 def render_frontmatter(data: dict) -> str:
     """
     Render a frontmatter dictionary to YAML string with delimiters.
@@ -82,35 +190,84 @@ def render_frontmatter(data: dict) -> str:
     Returns:
         YAML frontmatter string including --- delimiters
     """
-    if HAS_YAML:
-        # Custom representer for None to output 'null'
-        def represent_none(dumper, data):
-            return dumper.represent_scalar('tag:yaml.org,2002:null', 'null')
-
-        yaml.add_representer(type(None), represent_none)
-        yaml_content = yaml.dump(data, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    yaml_support = get_yaml()
+    if yaml_support:
+        yaml, _, dumper = yaml_support
+        # The safe dumper already renders None as 'null'
+        yaml_content = yaml.dump(
+            data, Dumper=dumper, default_flow_style=False, sort_keys=False, allow_unicode=True
+        )
         return f"---\n{yaml_content}---\n"
     else:
         # Basic fallback rendering
-        lines = ['---']
+        lines = []
         for key, value in data.items():
             if value is None:
-                lines.append(f"{key}: null")
+                value = 'null'
             elif isinstance(value, list):
-                if not value:
-                    lines.append(f"{key}: []")
-                else:
-                    lines.append(f"{key}: [{', '.join(str(v) for v in value)}]")
-            else:
-                lines.append(f"{key}: {value}")
-        lines.append('---')
-        return '\n'.join(lines) + '\n'
+                value = f"[{', '.join(map(str, value))}]"
+            lines.append(f"{key}: {value}\n")
+        return ''.join(('---\n', *lines, '---\n'))
+
+
+def format_scalar(value) -> Optional[str]:
+    """
+    Render a single value the way the YAML dumper would.
+
+    Args:
+        value: Field value
+
+    Returns:
+        YAML text for the value, or None if it is not a simple scalar
+    """
+    if value is None:
+        return 'null'
+    if not isinstance(value, str):
+        return None
+    if PLAIN_SCALAR_PATTERN.fullmatch(value) and value.lower() not in YAML_KEYWORDS:
+        return value
+    return "'" + value.replace("'", "''") + "'"
+
+
+def replace_frontmatter_lines(content: str, updates: dict) -> Optional[str]:
+    """
+    Rewrite existing single-line fields in place, leaving other lines untouched.
+
+    Args:
+        content: Full document content
+        updates: Dictionary of fields to update
+
+    Returns:
+        Updated document content, or None if any field is missing, spans
+        several lines or is not a simple scalar
+    """
+    end = find_frontmatter_end(content)
+    if end < 0:
+        return None
+
+    frontmatter_text = content[len(FRONTMATTER_OPEN):end + 1]
+    for key, value in updates.items():
+        rendered = format_scalar(value)
+        if rendered is None:
+            return None
+        start = frontmatter_text.find(f'\n{key}:') + 1
+        if not start and not frontmatter_text.startswith(f'{key}:'):
+            return None
+        line_end = frontmatter_text.index('\n', start)
+        if frontmatter_text.startswith(('-', ' '), line_end + 1):
+            return None
+        frontmatter_text = f'{frontmatter_text[:start]}{key}: {rendered}{frontmatter_text[line_end:]}'
+
+    return FRONTMATTER_OPEN + frontmatter_text + content[end + 1:]
 
 
 def update_frontmatter(content: str, updates: dict) -> str:
     """
     Update specific fields in a document's frontmatter.
 
+    Existing scalar fields are rewritten in place; anything else falls back
+    to a full parse and re-render.
+
     Args:
         content: Full document content
         updates: Dictionary of fields to update
@@ -118,7 +275,12 @@ def update_frontmatter(content: str, updates: dict) -> str:
     Returns:
         Updated document content
     """
+    updated = replace_frontmatter_lines(content, updates)
+    if updated is not None:
+        return updated
     frontmatter, body = parse_frontmatter(content)
+    if all(k in frontmatter and frontmatter[k] == v for k, v in updates.items()):
+        return content
     frontmatter.update(updates)
     return render_frontmatter(frontmatter) + body
 
@@ -141,7 +303,7 @@ def get_frontmatter_field(content: str, field: str, default=None):
 
 def has_frontmatter(content: str) -> bool:
     """Check if document has frontmatter."""
-    return bool(FRONTMATTER_PATTERN.match(content))
+    return find_frontmatter_end(content) >= 0
 
 
 def has_addenda_section(content: str) -> bool:
@@ -164,21 +326,16 @@ def append_addendum(content: str, title: str, body: str) -> str:
     Returns:
         Updated document content
     """
-    date = datetime.now().strftime("%Y-%m-%d")
-    addendum_entry = f"\n### {date}: {title}\n\n{body}\n"
+    today = get_today()
 
     # Update modified date in frontmatter
-    frontmatter, doc_body = parse_frontmatter(content)
-    if frontmatter:
-        frontmatter['modified'] = date
-        content = render_frontmatter(frontmatter) + doc_body
-
-    if has_addenda_section(content):
-        # Append to existing addenda section
-        return content.rstrip() + addendum_entry
-    else:
-        # Create addenda section
-        return content.rstrip() + ADDENDA_SEPARATOR + addendum_entry.lstrip('\n')
+    if has_frontmatter(content):
+        content = update_frontmatter(content, {'modified': today})
+
+    # Create the addenda section if needed, then append to it
+    separator = '\n' if has_addenda_section(content) else ADDENDA_SEPARATOR
+    trimmed = len(content.rstrip())
+    return ''.join((content[:trimmed], separator, '### ', today, ': ', title, '\n\n', body, '\n'))
 
 
 def create_frontmatter(
@@ -203,7 +360,7 @@ def create_frontmatter(
     Returns:
         Frontmatter dictionary
     """
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = get_today()
     return {
         'type': doc_type,
         'id': doc_id,
@@ -217,6 +374,20 @@ def create_frontmatter(
     }
 
 
+def search_body(pattern: re.Pattern, content: str) -> Optional[re.Match]:
+    """
+    Search for a body section, trying the top of the document first.
+
+    Titles and leading sections sit near the top of every template, so the
+    whole body is only scanned when the first BODY_SCAN_WINDOW characters
+    hold no complete match.
+    """
+    match = pattern.search(content, 0, BODY_SCAN_WINDOW)
+    if match and match.end() < BODY_SCAN_WINDOW:
+        return match
+    return pattern.search(content)
+
+
 def extract_status_from_body(content: str) -> Optional[str]:
     """
     Extract status from the ## Status section in document body.
@@ -227,13 +398,83 @@ def extract_status_from_body(content: str) -> Optional[str]:
     Returns:
         Status string or None if not found
     """
-    # Look for ## Status section
-    status_match = re.search(r'^## Status\s*\n+([^\n#]+)', content, re.MULTILINE)
-    if status_match:
-        return status_match.group(1).strip()
+    # Find a "## Status" heading line, then the first non-blank line after it
+    start = 0
+    while (start := content.find(STATUS_HEADING, start)) >= 0:
+        at_line_start = start == 0 or content[start - 1] == '\n'
+        start += len(STATUS_HEADING)
+        if not at_line_start:
+            continue
+
+        # Skip trailing whitespace on the heading line and any blank lines
+        pos = start
+        while pos < len(content) and content[pos].isspace():
+            pos += 1
+        if content.rfind('\n', start, pos) < 0:
+            continue  # Heading is followed by text, e.g. "## Statuses"
+
+        # The status runs to the end of its line or a '#'
+        line_end = content.find('\n', pos)
+        if line_end < 0:
+            line_end = len(content)
+        status = content[pos:line_end].partition('#')[0].strip()
+        if status:
+            return status
+
     return None
 
 
+def find_status_value(content: str) -> Optional[tuple[int, int]]:
+    """
+    Locate the status value of a document's single "## Status" section.
+
+    Plain string scans handle the usual layout (heading, blank line, value);
+    anything else is left to STATUS_VALUE_PATTERN.
+
+    Returns:
+        (start, end) offsets of the status text, or None if the section is
+        missing, repeated or not laid out as expected
+    """
+    start = content.find(STATUS_HEADING + '\n')
+    if start < 0 or content.count(STATUS_HEADING) != 1:
+        return None
+
+    # Skip blank lines up to the value, which runs to the end of its line or a '#'
+    pos = start + len(STATUS_HEADING)
+    while pos < len(content) and content[pos].isspace():
+        pos += 1
+    end = content.find('\n', pos)
+    if end < 0:
+        end = len(content)
+    hash_pos = content.find('#', pos, end)
+    if hash_pos >= 0:
+        end = hash_pos
+
+    if end == pos:
+        return None
+    return pos, end
+
+
+def set_body_status(content: str, status: str) -> Optional[str]:
+    """
+    Replace the value of the ## Status section(s) in a document.
+
+    Args:
+        content: Document content
+        status: New status text, as displayed (e.g. 'Superseded')
+
+    Returns:
+        Updated content, or None if the document has no Status section
+    """
+    span = find_status_value(content)
+    if span:
+        start, end = span
+        return content[:start] + status + content[end:]
+
+    content, count = STATUS_VALUE_PATTERN.subn(lambda match: match.group(1) + status, content)
+    return content if count else None
+
+
 def extract_title_from_body(content: str) -> Optional[str]:
     """
     Extract title from the H1 heading in document body.
@@ -245,7 +486,7 @@ def extract_title_from_body(content: str) -> Optional[str]:
         Title string (without ID prefix) or None if not found
     """
     # Look for # heading, optionally with ID prefix
-    title_match = re.search(r'^# (?:(?:ADR|FDP|AP|RPT)-\d+:\s*)?(.+)$', content, re.MULTILINE)
+    title_match = search_body(TITLE_PATTERN, content)
     if title_match:
         return title_match.group(1).strip()
     return None
@@ -262,7 +503,52 @@ def extract_date_from_body(content: str) -> Optional[str]:
         Date string (ISO format) or None if not found
     """
     # Look for ## Date or ## Created section
-    date_match = re.search(r'^## (?:Date|Created)\s*\n+(\d{4}-\d{2}-\d{2})', content, re.MULTILINE)
+    date_match = search_body(DATE_SECTION_PATTERN, content)
     if date_match:
         return date_match.group(1)
     return None
+
+
+@dataclass(frozen=True)
+class DocMeta:
+    """
+    A parsed planning document.
+
+    Instances are shared through the load_doc() cache: treat frontmatter as
+    read-only and copy it before making changes.
+    """
+    frontmatter: dict
+    body: str
+    title: Optional[str]
+
+
+@functools.lru_cache(maxsize=4096)
+def load_doc(path: str, mtime_ns: int) -> DocMeta:
+    """
+    Read and parse a document once per (path, mtime).
+
+    The mtime is part of the cache key, so a modified file is re-read.
+
+    Args:
+        path: Path to the document
+        mtime_ns: The file's st_mtime_ns
+
+    Returns:
+        Parsed document
+    """
+    with open(path, encoding='utf-8') as f:
+        content = f.read()
+    frontmatter, body = parse_frontmatter(content)
+    if not isinstance(frontmatter, dict):
+        frontmatter, body = {}, content
+
+    return DocMeta(
+        frontmatter=frontmatter,
+        body=body,
+        title=extract_title_from_body(body),
+    )
+
+
+def read_doc(filepath: Path) -> DocMeta:
+    """Load a document through the load_doc() cache."""
+    return load_doc(str(filepath), filepath.stat().st_mtime_ns)
@@ -14,10 +14,9 @@ The roadmap is created at <planning_root>/roadmap.md
 import argparse
 import os
 import sys
-from datetime import date
 from pathlib import Path
 
-from config import get_planning_root, get_project_dir
+from config import get_planning_root, get_project_dir, get_today
 
 
 def get_template_path() -> Path:
@@ -46,7 +45,12 @@ def init_roadmap(project_dir: Path, force: bool = False) -> Path:
 
     # Read template and substitute date
     content = template_path.read_text()
-    content = content.replace('{{DATE}}', date.today().isoformat())
+    content = content.replace('{{DATE}}', get_today())
+
+    # Leave an identical roadmap untouched (e.g. --force on the same day)
+    if roadmap_path.exists() and roadmap_path.read_text() == content:
+        print(f"Unchanged: {roadmap_path.relative_to(project_dir)}")
+        return roadmap_path
 
     # Ensure directory exists
     roadmap_path.parent.mkdir(parents=True, exist_ok=True)
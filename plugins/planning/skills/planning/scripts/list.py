@@ -14,68 +14,40 @@ Examples:
 """
 
 import argparse
-import re
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator, TextIO
 
 from config import (
     get_project_dir,
     get_planning_root,
     get_all_types,
-    get_type_config,
 )
-from frontmatter import parse_frontmatter, extract_status_from_body, extract_title_from_body
-
-
-def extract_status(filepath: Path) -> str:
-    """Extract status from a document (frontmatter or body)."""
-    try:
-        content = filepath.read_text()
-
-        # Try frontmatter first
-        frontmatter, body = parse_frontmatter(content)
-        if frontmatter and 'status' in frontmatter:
-            status = frontmatter['status']
-            # Capitalize for display
-            return status.title() if isinstance(status, str) else str(status)
-
-        # Fallback to body parsing
-        status = extract_status_from_body(content)
-        if status:
-            return status
-
-        return 'Unknown'
-    except Exception:
-        return 'Error'
-
-
-def extract_title(filepath: Path) -> str:
-    """Extract title from a document (frontmatter or body)."""
-    try:
-        content = filepath.read_text()
-
-        # Try frontmatter ID to find title in body
-        frontmatter, body = parse_frontmatter(content)
-
-        # Extract from body (works with or without frontmatter)
-        title = extract_title_from_body(body if frontmatter else content)
-        if title:
-            return title
-
-        return filepath.stem
-    except Exception:
-        return filepath.stem
-
-
-def get_number_pattern(doc_type: str) -> re.Pattern:
-    """Get regex pattern to extract number from filename."""
-    type_config = get_type_config(doc_type)
-    prefix = type_config.get('prefix', '')
+from doc_index import load_index, save_index, get_metadata, status_matches
+from planning_ids import get_number_pattern
+
+
+def iter_candidate_files(doc_dir: Path, include_archived: bool) -> Iterator[tuple[os.DirEntry, bool]]:
+    """
+    Yield (entry, archived) for the files in a type directory and, if
+    requested, its archive, each sorted by name (no per-file stat).
+    """
+    directories = [(doc_dir, False)]
+    if include_archived:
+        directories.append((doc_dir / 'archive', True))
+
+    for directory, archived in directories:
+        try:
+            with os.scandir(directory) as entries:
+                files = [entry for entry in entries if entry.is_file()]
+        except FileNotFoundError:
+            continue
 
-    if prefix:
-        return re.compile(rf'^{re.escape(prefix)}(\d+)-(.*)\.md$')
-    else:
-        return re.compile(r'^(\d+)-(.*)\.md$')
+        files.sort(key=lambda entry: entry.name)
+        for entry in files:
+            yield entry, archived
 
 
 def list_documents(
@@ -85,12 +57,17 @@ def list_documents(
     include_archived: bool = False,
 ) -> list[dict]:
     """List planning documents."""
-    documents = []
-
     all_types = get_all_types()
     types_to_check = [doc_type] if doc_type else list(all_types.keys())
 
     planning_root = project_dir / get_planning_root()
+    # Displayed paths are relative to the project; build them by string prefix
+    planning_prefix = os.path.join(planning_root.relative_to(project_dir), '')
+    if planning_prefix == '.' + os.sep:
+        planning_prefix = ''
+
+    # Collect (id, type label, index key, path, archived, display path) per document
+    candidates = []
 
     for dtype in types_to_check:
         type_config = all_types.get(dtype)
@@ -98,99 +75,68 @@ def list_documents(
             continue
 
         doc_dir = planning_root / type_config['dir']
+        pattern = get_number_pattern(type_config.get('prefix', ''))
+        id_format = type_config.get('id_format', '{number:03d}')
+        label = type_config.get('name', dtype.upper())
+        subdirs = {
+            False: type_config['dir'] + os.sep,
+            True: os.path.join(type_config['dir'], 'archive') + os.sep,
+        }
+
+        for entry, archived in iter_candidate_files(doc_dir, include_archived):
+            match = pattern.match(entry.name)
+            if match:
+                doc_id = id_format.format(number=int(match.group(1)))
+                subpath = subdirs[archived] + entry.name
+                path = planning_prefix + subpath
+                candidates.append((doc_id, label, path.replace(os.sep, '/'), Path(entry.path), archived, path))
+
+    if not candidates:
+        return []
+
+    # Read documents concurrently; map() keeps the listing order
+    index = load_index(project_dir)
+    with ThreadPoolExecutor(max_workers=min(32, len(candidates))) as executor:
+        results = list(executor.map(
+            lambda candidate: get_metadata(index, candidate[2], candidate[3], status_filter),
+            candidates,
+        ))
+
+    documents = []
+    index_changed = False
+
+    for (doc_id, label, _, _, archived, path), (status, title, changed) in zip(candidates, results):
+        index_changed |= changed
 
-        if not doc_dir.exists():
+        if not status_matches(status, status_filter):
             continue
 
-        pattern = get_number_pattern(dtype)
-        id_format = type_config.get('id_format', '{number:03d}')
-        label = type_config.get('name', dtype.upper())
+        documents.append({
+            'id': doc_id,
+            'type': label,
+            'title': title,
+            'status': status,
+            'path': path,
+            'archived': archived,
+        })
 
-        # Check main directory
-        for f in sorted(doc_dir.iterdir()):
-            if not f.is_file():
-                continue
-
-            match = pattern.match(f.name)
-            if not match:
-                continue
-
-            number = int(match.group(1))
-            status = extract_status(f)
-            title = extract_title(f)
-
-            doc_info = {
-                'id': id_format.format(number=number),
-                'type': label,
-                'title': title,
-                'status': status,
-                'path': str(f.relative_to(project_dir)),
-                'archived': False,
-            }
-
-            if status_filter and status.lower() != status_filter.lower():
-                continue
-
-            documents.append(doc_info)
-
-        # Check archive directory
-        if include_archived:
-            archive_dir = doc_dir / 'archive'
-            if archive_dir.exists():
-                for f in sorted(archive_dir.iterdir()):
-                    if not f.is_file():
-                        continue
-
-                    match = pattern.match(f.name)
-                    if not match:
-                        continue
-
-                    number = int(match.group(1))
-                    status = extract_status(f)
-                    title = extract_title(f)
-
-                    doc_info = {
-                        'id': id_format.format(number=number),
-                        'type': label,
-                        'title': title,
-                        'status': status,
-                        'path': str(f.relative_to(project_dir)),
-                        'archived': True,
-                    }
-
-                    if status_filter and status.lower() != status_filter.lower():
-                        continue
-
-                    documents.append(doc_info)
+    if index_changed:
+        save_index(project_dir, index)
 
     return documents
 
 
-def format_table(documents: list[dict]) -> str:
-    """Format documents as a table."""
+def write_table(documents: list[dict], out: TextIO) -> None:
+    """Write documents as a table."""
     if not documents:
-        return "No documents found."
+        out.write("No documents found.\n")
+        return
 
-    # Calculate column widths
-    headers = ['ID', 'Type', 'Status', 'Title']
+    # Build display rows and column widths in one pass
+    headers = ('ID', 'Type', 'Status', 'Title')
     widths = [len(h) for h in headers]
+    rows = []
 
-    for doc in documents:
-        widths[0] = max(widths[0], len(doc['id']))
-        widths[1] = max(widths[1], len(doc['type']))
-        widths[2] = max(widths[2], len(doc['status']) + (4 if doc['archived'] else 0))
-        widths[3] = max(widths[3], min(len(doc['title']), 50))
-
-    # Format header
-    header_fmt = ' | '.join(f"{{:<{w}}}" for w in widths)
-    separator = '-+-'.join('-' * w for w in widths)
-
-    lines = [
-        header_fmt.format(*headers),
-        separator,
-    ]
-
-    # Format rows
     for doc in documents:
         status = doc['status']
         if doc['archived']:
@@ -200,14 +146,16 @@ def format_table(documents: list[dict]) -> str:
         if len(title) > 50:
             title = title[:47] + '...'
 
-        lines.append(header_fmt.format(
-            doc['id'],
-            doc['type'],
-            status,
-            title,
-        ))
+        row = (doc['id'], doc['type'], status, title)
+        widths = [max(w, len(cell)) for w, cell in zip(widths, row)]
+        rows.append(row)
+
+    row_fmt = ' | '.join(f'%-{w}s' for w in widths) + '\n'
+    separator = '-+-'.join('-' * w for w in widths)
 
-    return '\n'.join(lines)
+    out.write(row_fmt % headers)
+    out.write(separator + '\n')
+    out.writelines(row_fmt % row for row in rows)
 
 
 def main():
@@ -247,7 +195,7 @@ def main():
         include_archived=args.include_archived,
     )
 
-    print(format_table(documents))
+    write_table(documents, sys.stdout)
 
 
 if __name__ == '__main__':
@@ -19,12 +19,14 @@ Examples:
 """
 
 import argparse
+import functools
 import os
 import re
+import string
 import sys
-from datetime import date
 from pathlib import Path
 from string import Template
+from typing import Iterator
 
 from config import (
     get_project_dir,
@@ -32,67 +34,82 @@ from config import (
     get_type_config,
     get_doc_dir,
     get_template_path,
+    format_doc_id,
     format_filename,
+    get_today,
 )
+from doc_index import index_documents
+from frontmatter import has_frontmatter, update_frontmatter
+from planning_ids import get_number_pattern
 
+# Parsed templates by path, with the st_mtime_ns they were read at
+_template_cache: dict[Path, tuple[int, Template]] = {}
 
-def slugify(title: str) -> str:
-    """Convert title to URL-friendly slug."""
-    slug = title.lower()
-    slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-    slug = re.sub(r'[\s_]+', '-', slug)
-    slug = re.sub(r'-+', '-', slug)
-    slug = slug.strip('-')
-    return slug
+# Characters kept as-is in slugs
+SLUG_CHARS = frozenset(string.ascii_lowercase + string.digits + '-')
 
 
-def get_number_pattern(doc_type: str) -> str:
-    """Get regex pattern to extract number from filename."""
-    type_config = get_type_config(doc_type)
-    prefix = type_config.get('prefix', '')
-
-    if prefix:
-        # Pattern like FDP-001-slug.md or AP-001-slug.md
-        return rf'^{re.escape(prefix)}(\d+)-.*\.md$'
-    else:
-        # Pattern like 001-slug.md (ADRs)
-        return r'^(\d+)-.*\.md$'
-
-
-def find_next_number(doc_dir: Path, pattern: str) -> int:
-    """Find the next available document number."""
-    if not doc_dir.exists():
-        return 1
-
-    max_num = 0
-    regex = re.compile(pattern)
-
-    for f in doc_dir.iterdir():
-        if f.is_file():
-            match = regex.match(f.name)
-            if match:
-                num = int(match.group(1))
-                max_num = max(max_num, num)
-
-    # Also check archive directory
-    archive_dir = doc_dir / 'archive'
-    if archive_dir.exists():
-        for f in archive_dir.iterdir():
-            if f.is_file():
-                match = regex.match(f.name)
-                if match:
-                    num = int(match.group(1))
-                    max_num = max(max_num, num)
-
-    return max_num + 1
-
-
-def load_template(doc_type: str) -> str:
-    """Load template content for a document type."""
-    template_path = get_template_path(doc_type)
+class SlugTable(dict):
+    """
+    str.translate() table for slugs, filled in lazily per character.
+
+    Keeps ASCII letters, digits and '-', turns whitespace into '-' and
+    drops everything else.
+    """
 
-    if template_path and template_path.exists():
-        return template_path.read_text()
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        if char in SLUG_CHARS:
+            value = codepoint
+        elif char.isspace():
+            value = '-'
+        else:
+            value = None
+        self[codepoint] = value
+        return value
+
+
+SLUG_TABLE = SlugTable()
+
+
+def slugify(title: str) -> str:
+    """Convert title to URL-friendly slug."""
+    slug = title.lower().translate(SLUG_TABLE)
+    # Collapse runs of '-' and trim them from both ends
+    return '-'.join(part for part in slug.split('-') if part)
+
+
+def iter_numbers(doc_dir: Path, regex: re.Pattern) -> Iterator[int]:
+    """Yield the numbers of the documents in a type directory and its archive."""
+    for directory in (doc_dir, doc_dir / 'archive'):
+        try:
+            entries = os.scandir(directory)
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                match = regex.match(entry.name)
+                if match and entry.is_file():
+                    yield int(match.group(1))
+
+
+def find_next_number(doc_dir: Path, regex: re.Pattern) -> int:
+    """Find the next available document number (active and archived)."""
+    return max(iter_numbers(doc_dir, regex), default=0) + 1
+
+
+@functools.lru_cache(maxsize=8)
+def find_template(doc_type: str) -> Path:
+    """
+    Find the template file for a document type.
+
+    Templates do not move while a script runs, so each type is looked up
+    once; load_template() still notices edits to the file itself.
+    """
+    # get_template_path() only returns templates that exist
+    template_path = get_template_path(doc_type)
+    if template_path:
+        return template_path
 
     # Fallback: try to find template relative to script
     type_config = get_type_config(doc_type)
@@ -102,28 +119,62 @@ def load_template(doc_type: str) -> str:
     fallback_path = script_dir / template_name
 
     if fallback_path.exists():
-        return fallback_path.read_text()
+        return fallback_path
 
     # Try CLAUDE_PLUGIN_ROOT
     plugin_root = os.environ.get('CLAUDE_PLUGIN_ROOT')
     if plugin_root:
         plugin_path = Path(plugin_root) / 'skills' / 'planning' / 'templates' / template_name
         if plugin_path.exists():
-            return plugin_path.read_text()
+            return plugin_path
 
     raise FileNotFoundError(f"Template not found for type: {doc_type}")
 
 
-def create_document(doc_type: str, title: str, project_dir: Path) -> Path:
-    """Create a new planning document."""
+def load_template(doc_type: str) -> Template:
+    """
+    Load the template for a document type.
+
+    Templates are cached per path and reused while the file's
+    modification time is unchanged.
+    """
+    template_path = find_template(doc_type)
+    mtime_ns = template_path.stat().st_mtime_ns
+
+    cached = _template_cache.get(template_path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+
+    template = Template(template_path.read_text())
+    _template_cache[template_path] = (mtime_ns, template)
+    return template
+
+
+def create_document(
+    doc_type: str,
+    title: str,
+    project_dir: Path,
+    frontmatter: dict | None = None,
+) -> tuple[Path, str]:
+    """
+    Create a new planning document.
+
+    Args:
+        doc_type: Document type key
+        title: Document title
+        project_dir: Project root directory
+        frontmatter: Extra frontmatter fields to set before the file is written
+
+    Returns:
+        Tuple of (filepath, doc_id)
+    """
     type_config = get_type_config(doc_type)
 
     doc_dir = project_dir / get_doc_dir(doc_type)
     doc_dir.mkdir(parents=True, exist_ok=True)
 
     # Find next number
-    pattern = get_number_pattern(doc_type)
-    next_num = find_next_number(doc_dir, pattern)
+    next_num = find_next_number(doc_dir, get_number_pattern(type_config.get('prefix', '')))
 
     # Create filename using config format
     slug = slugify(title)
@@ -134,24 +185,23 @@ def create_document(doc_type: str, title: str, project_dir: Path) -> Path:
     if filepath.exists():
         raise FileExistsError(f"File already exists: {filepath}")
 
-    # Read template
-    template_content = load_template(doc_type)
-
     # Substitute variables
     # NUMBER is zero-padded for display in document
     num_str = f"{next_num:03d}"
 
-    template = Template(template_content)
-    content = template.safe_substitute(
+    content = load_template(doc_type).safe_substitute(
         NUMBER=num_str,
         TITLE=title,
-        DATE=date.today().isoformat(),
+        DATE=get_today(),
     )
+    if frontmatter and has_frontmatter(content):
+        content = update_frontmatter(content, frontmatter)
 
     # Write file
     filepath.write_text(content)
+    index_documents(project_dir, [filepath])
 
-    return filepath
+    return filepath, format_doc_id(doc_type, next_num)
 
 
 def main():
@@ -181,7 +231,7 @@ def main():
     args = parser.parse_args()
 
     try:
-        filepath = create_document(args.type, args.title, args.project_dir)
+        filepath, _ = create_document(args.type, args.title, args.project_dir)
         print(f"Created: {filepath}")
     except FileExistsError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -0,0 +1,122 @@
+"""
+Document IDs for planning scripts.
+
+Parses IDs like 'ADR-001' and finds the documents they refer to.
+"""
+
+import functools
+import os
+import re
+from pathlib import Path
+
+from config import get_planning_root, get_type_config
+
+# Document type by ID prefix (e.g. 'ADR' in 'ADR-001')
+DOC_ID_PREFIXES = {
+    'ADR': 'adr',
+    'FDP': 'fdp',
+    'AP': 'ap',
+    'RPT': 'report',
+}
+
+
+def parse_doc_id(doc_id: str) -> tuple[str, int]:
+    """
+    Parse a document ID into type and number.
+
+    Args:
+        doc_id: Document ID like 'ADR-001', 'FDP-002', 'AP-001', 'RPT-001'
+
+    Returns:
+        Tuple of (doc_type, number)
+
+    Raises:
+        ValueError: If ID format is not recognized
+    """
+    doc_id = doc_id.upper()
+
+    prefix, _, number = doc_id.partition('-')
+    doc_type = DOC_ID_PREFIXES.get(prefix)
+    if doc_type and number.isdecimal():
+        return doc_type, int(number)
+
+    raise ValueError(f"Invalid document ID: {doc_id}. Expected format: ADR-001, FDP-002, AP-003, or RPT-001")
+
+
+@functools.lru_cache(maxsize=None)
+def get_number_pattern(prefix: str) -> re.Pattern:
+    """Get compiled regex to extract number from filename (compiled once per prefix)."""
+    if prefix:
+        return re.compile(rf'^{re.escape(prefix)}(\d+)-.*\.md$')
+    return re.compile(r'^(\d+)-.*\.md$')
+
+
+@functools.lru_cache(maxsize=32)
+def scan_dir(directory: Path, mtime_ns: int, prefix: str) -> dict[int, Path]:
+    """
+    Index the numbered documents in a directory.
+
+    The directory's mtime is part of the cache key, so adding, removing or
+    renaming a document invalidates the cached index.
+    """
+    pattern = get_number_pattern(prefix)
+    index = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            match = pattern.match(entry.name)
+            if match and entry.is_file():
+                index.setdefault(int(match.group(1)), Path(entry.path))
+    return index
+
+
+def find_in_dir(directory: Path, doc_type: str, number: int) -> Path | None:
+    """Find a numbered document in a single directory."""
+    prefix = get_type_config(doc_type).get('prefix', '')
+    return scan_dir(directory, directory.stat().st_mtime_ns, prefix).get(number)
+
+
+def find_document(
+    doc_type: str,
+    number: int,
+    project_dir: Path,
+    include_archive: bool = True,
+) -> tuple[Path | None, bool]:
+    """
+    Find a document by type and number, checking the archive after the main directory.
+
+    Returns:
+        Tuple of (filepath, in_archive); filepath is None if not found
+    """
+    type_config = get_type_config(doc_type)
+    planning_root = project_dir / get_planning_root()
+    doc_dir = planning_root / type_config['dir']
+
+    if not doc_dir.exists():
+        return None, False
+
+    directories = [(doc_dir, False)]
+    if include_archive:
+        directories.append((doc_dir / 'archive', True))
+
+    for directory, in_archive in directories:
+        if directory.exists():
+            filepath = find_in_dir(directory, doc_type, number)
+            if filepath:
+                return filepath, in_archive
+
+    return None, False
+
+
+def find_document_by_id(doc_id: str, project_dir: Path) -> Path:
+    """
+    Find a document by its full ID, in the active or archive directory.
+
+    Raises:
+        ValueError: If the ID format is not recognized
+        FileNotFoundError: If the document does not exist
+    """
+    doc_type, number = parse_doc_id(doc_id)
+    filepath, _ = find_document(doc_type, number, project_dir)
+    if not filepath:
+        raise FileNotFoundError(f"Document not found: {doc_id}")
+    return filepath
@@ -15,100 +15,44 @@ to the second document.
 """
 
 import argparse
-import re
 import sys
-from datetime import date
 from pathlib import Path
 
 from config import (
     get_project_dir,
-    get_planning_root,
-    get_type_config,
+    get_today,
 )
-from frontmatter import parse_frontmatter, render_frontmatter
+from doc_index import index_documents
+from frontmatter import read_doc, render_frontmatter, write_atomic
+from planning_ids import find_document_by_id
 
 
-def parse_doc_id(doc_id: str) -> tuple[str, int]:
-    """Parse a document ID into type and number."""
-    doc_id = doc_id.upper()
-
-    patterns = [
-        (r'^ADR-(\d+)$', 'adr'),
-        (r'^FDP-(\d+)$', 'fdp'),
-        (r'^AP-(\d+)$', 'ap'),
-        (r'^RPT-(\d+)$', 'report'),
-    ]
-
-    for pattern, doc_type in patterns:
-        match = re.match(pattern, doc_id)
-        if match:
-            return doc_type, int(match.group(1))
-
-    raise ValueError(f"Invalid document ID: {doc_id}")
-
-
-def find_document(doc_type: str, number: int, project_dir: Path) -> Path | None:
-    """Find a document by type and number."""
-    type_config = get_type_config(doc_type)
-    planning_root = project_dir / get_planning_root()
-    doc_dir = planning_root / type_config['dir']
-
-    if not doc_dir.exists():
-        return None
-
-    prefix = type_config.get('prefix', '')
-    if prefix:
-        pattern = re.compile(rf'^{re.escape(prefix)}(\d+)-.*\.md$')
-    else:
-        pattern = re.compile(r'^(\d+)-.*\.md$')
-
-    # Check main directory
-    for f in doc_dir.iterdir():
-        if f.is_file():
-            match = pattern.match(f.name)
-            if match and int(match.group(1)) == number:
-                return f
-
-    # Check archive
-    archive_dir = doc_dir / 'archive'
-    if archive_dir.exists():
-        for f in archive_dir.iterdir():
-            if f.is_file():
-                match = pattern.match(f.name)
-                if match and int(match.group(1)) == number:
-                    return f
-
-    return None
-
+def load_document(filepath: Path) -> tuple[dict, str]:
+    """
+    Read and parse a document for relating.
 
-def find_document_by_id(doc_id: str, project_dir: Path) -> Path:
-    """Find a document by its full ID."""
-    doc_type, number = parse_doc_id(doc_id)
-    filepath = find_document(doc_type, number, project_dir)
-    if not filepath:
-        raise FileNotFoundError(f"Document not found: {doc_id}")
-    return filepath
+    Returns:
+        Tuple of (frontmatter, body); frontmatter is empty if the document
+        has none, in which case a warning is printed and it is left alone
+    """
+    doc = read_doc(filepath)
+    if not doc.frontmatter:
+        print(f"Warning: {filepath} has no frontmatter, skipping", file=sys.stderr)
+    # The parsed document is shared through the cache, so edit a copy
+    return dict(doc.frontmatter), doc.body
 
 
-def add_related(filepath: Path, related_id: str) -> bool:
+def add_related(frontmatter: dict, related_id: str, today: str) -> bool:
     """
-    Add a related document ID to a document's frontmatter.
+    Add a related document ID to parsed frontmatter.
 
-    Returns True if added, False if already present.
+    Returns True if added, False if already present (or no frontmatter).
     """
-    content = filepath.read_text()
-    today = date.today().isoformat()
-
-    frontmatter, body = parse_frontmatter(content)
-
     if not frontmatter:
-        print(f"Warning: {filepath} has no frontmatter, skipping", file=sys.stderr)
         return False
 
     # Get current related list
-    related = frontmatter.get('related', [])
-    if related is None:
-        related = []
+    related = list(frontmatter.get('related') or [])
 
     # Normalize to uppercase for comparison
     related_upper = [r.upper() for r in related]
@@ -122,10 +66,6 @@ def add_related(filepath: Path, related_id: str) -> bool:
     frontmatter['related'] = related
     frontmatter['modified'] = today
 
-    # Write back
-    new_content = render_frontmatter(frontmatter) + body
-    filepath.write_text(new_content)
-
     return True
 
 
@@ -138,29 +78,53 @@ def relate_documents(
     """
     Add related document links.
 
+    Each document is read and parsed once and written once, after all of
+    its new links have been added.
+
     Returns:
         Tuple of (added_ids, already_present_ids)
     """
+    today = get_today()
+
     # Find the main document
     main_filepath = find_document_by_id(doc_id, project_dir)
 
+    # Parsed (frontmatter, body) by path, and the paths that need writing
+    documents = {main_filepath: load_document(main_filepath)}
+    modified = []
+
+    def relate(filepath: Path, related_id: str) -> bool:
+        if filepath not in documents:
+            documents[filepath] = load_document(filepath)
+        if not add_related(documents[filepath][0], related_id, today):
+            return False
+        if filepath not in modified:
+            modified.append(filepath)
+        return True
+
     added = []
     already_present = []
 
     for related_id in related_ids:
         # Verify related document exists
-        find_document_by_id(related_id, project_dir)
+        related_filepath = find_document_by_id(related_id, project_dir)
 
         # Add to main document
-        if add_related(main_filepath, related_id):
+        if relate(main_filepath, related_id):
             added.append(related_id)
         else:
             already_present.append(related_id)
 
         # Add bidirectional link if requested
         if bidirectional:
-            related_filepath = find_document_by_id(related_id, project_dir)
-            add_related(related_filepath, doc_id)
+            relate(related_filepath, doc_id)
+
+    # Write back
+    for filepath in modified:
+        frontmatter, body = documents[filepath]
+        write_atomic(filepath, render_frontmatter(frontmatter) + body)
+
+    index_documents(project_dir, modified)
 
     return added, already_present
 
@@ -4,93 +4,42 @@ Update the status of a planning document.
 
 Usage:
     update-status.py <doc-id> <new-status>
+    update-status.py --batch FILE
 
 Examples:
     update-status.py ADR-001 accepted
     update-status.py FDP-002 "in progress"
     update-status.py AP-003 completed
     update-status.py RPT-001 published
+    printf 'ADR-001 accepted\nAP-003 completed\n' | update-status.py --batch -
+
+With --batch, each line of FILE ('-' for stdin) holds a document ID and its
+new status, separated by whitespace; blank lines and lines starting with '#'
+are skipped. All updates run in one process, and the exit status is 1 if
+any of them failed.
 
 Valid statuses are determined by each document type's configuration.
 """
 
 import argparse
-import re
 import sys
-from datetime import date
 from pathlib import Path
 
 from config import (
     get_project_dir,
-    get_planning_root,
     get_type_config,
     get_valid_statuses,
     is_archive_trigger,
+    is_valid_status,
+    get_today,
 )
-from frontmatter import parse_frontmatter, render_frontmatter, extract_status_from_body
-
-
-def parse_doc_id(doc_id: str) -> tuple[str, int]:
-    """
-    Parse a document ID into type and number.
-
-    Args:
-        doc_id: Document ID like 'ADR-001', 'FDP-002', 'AP-001', 'RPT-001'
-
-    Returns:
-        Tuple of (doc_type, number)
-
-    Raises:
-        ValueError: If ID format is not recognized
-    """
-    doc_id = doc_id.upper()
-
-    patterns = [
-        (r'^ADR-(\d+)$', 'adr'),
-        (r'^FDP-(\d+)$', 'fdp'),
-        (r'^AP-(\d+)$', 'ap'),
-        (r'^RPT-(\d+)$', 'report'),
-    ]
-
-    for pattern, doc_type in patterns:
-        match = re.match(pattern, doc_id)
-        if match:
-            return doc_type, int(match.group(1))
-
-    raise ValueError(f"Invalid document ID: {doc_id}. Expected format: ADR-001, FDP-002, AP-003, or RPT-001")
+from frontmatter import parse_frontmatter, render_frontmatter, extract_status_from_body, set_body_status, write_atomic
+from planning_ids import parse_doc_id, find_document
 
 
-def find_document(doc_type: str, number: int, project_dir: Path) -> Path | None:
-    """Find a document by type and number (not in archive)."""
-    type_config = get_type_config(doc_type)
-    planning_root = project_dir / get_planning_root()
-    doc_dir = planning_root / type_config['dir']
-
-    if not doc_dir.exists():
-        return None
-
-    # Build pattern based on type config
-    prefix = type_config.get('prefix', '')
-    if prefix:
-        pattern = re.compile(rf'^{re.escape(prefix)}(\d+)-.*\.md$')
-    else:
-        pattern = re.compile(r'^(\d+)-.*\.md$')
-
-    for f in doc_dir.iterdir():
-        if f.is_file():
-            match = pattern.match(f.name)
-            if match and int(match.group(1)) == number:
-                return f
-
-    return None
-
-
-def extract_current_status(filepath: Path) -> str:
-    """Extract current status from a document (frontmatter or body)."""
-    content = filepath.read_text()
-
+def extract_current_status(frontmatter: dict, content: str) -> str:
+    """Extract current status from a parsed document (frontmatter or body)."""
     # Try frontmatter first
-    frontmatter, body = parse_frontmatter(content)
     if frontmatter and 'status' in frontmatter:
         return frontmatter['status']
 
@@ -102,12 +51,17 @@ def extract_current_status(filepath: Path) -> str:
     return 'Unknown'
 
 
-def update_status_in_content(content: str, new_status: str) -> str:
-    """Update status in both frontmatter and body."""
-    today = date.today().isoformat()
+def update_status_in_content(content: str, new_status: str, frontmatter: dict, body: str) -> str:
+    """
+    Update status in both frontmatter and body.
 
-    # Parse frontmatter
-    frontmatter, body = parse_frontmatter(content)
+    Args:
+        content: Full document content
+        new_status: Status to set
+        frontmatter: Parsed frontmatter of content (updated in place)
+        body: Body of content, as returned by parse_frontmatter()
+    """
+    today = get_today()
 
     # Update frontmatter if present
     if frontmatter:
@@ -118,16 +72,9 @@ def update_status_in_content(content: str, new_status: str) -> str:
         new_content = content
 
     # Update body status section
-    status_pattern = r'(## Status\s*\n\s*\n?)([^\n#]+)'
-    formatted_status = new_status.title()
-
-    def replace_status(match):
-        prefix = match.group(1)
-        return f"{prefix}{formatted_status}"
+    new_content = set_body_status(new_content, new_status.title())
 
-    new_content, count = re.subn(status_pattern, replace_status, new_content)
-
-    if count == 0:
+    if new_content is None:
         raise ValueError("Could not find Status section in document")
 
     return new_content
@@ -135,10 +82,8 @@ def update_status_in_content(content: str, new_status: str) -> str:
 
 def validate_status(doc_type: str, new_status: str) -> str | None:
     """Validate status is valid for document type. Returns error message or None."""
-    valid = get_valid_statuses(doc_type)
-    normalized = new_status.lower().strip()
-
-    if normalized not in [s.lower() for s in valid]:
+    if not is_valid_status(doc_type, new_status.lower().strip()):
+        valid = get_valid_statuses(doc_type)
         type_config = get_type_config(doc_type)
         type_name = type_config.get('name', doc_type.upper())
         return f"Invalid status '{new_status}' for {type_name}. Valid statuses: {', '.join(valid)}"
@@ -161,40 +106,108 @@ def update_document_status(doc_id: str, new_status: str, project_dir: Path) -> t
         raise ValueError(error)
 
     # Find the document
-    filepath = find_document(doc_type, number, project_dir)
+    filepath, in_archive = find_document(doc_type, number, project_dir)
     if not filepath:
         raise FileNotFoundError(f"Document not found: {doc_id}")
 
     # Check if already archived
-    if 'archive' in filepath.parts:
+    if in_archive:
         raise ValueError(f"Cannot update archived document: {filepath}")
 
+    # Read and parse once for both the current status and the update
+    content = filepath.read_text(encoding='utf-8')
+    frontmatter, body = parse_frontmatter(content)
+
     # Get current status
-    old_status = extract_current_status(filepath)
+    old_status = extract_current_status(frontmatter, content)
 
     # Update status
-    content = filepath.read_text()
-    new_content = update_status_in_content(content, new_status)
-    filepath.write_text(new_content)
+    new_content = update_status_in_content(content, new_status, frontmatter, body)
+    write_atomic(filepath, new_content)
 
     # Check if should suggest archiving
-    should_archive = is_archive_trigger(doc_type, new_status)
+    should_archive = is_archive_trigger(doc_type, new_status.lower().strip())
 
     return filepath, old_status, should_archive
 
 
+def read_batch(source: str) -> list[tuple[str, str]]:
+    """Read (doc_id, status) pairs, one per line, from a file or '-' for stdin."""
+    if source == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = Path(source).read_text().splitlines()
+
+    updates = []
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        fields = line.split(None, 1)
+        if len(fields) != 2:
+            raise ValueError(f"Line {line_number}: expected '<doc-id> <new-status>', got '{line}'")
+        updates.append((fields[0], fields[1]))
+    return updates
+
+
+def run_updates(updates: list[tuple[str, str]], project_dir: Path) -> bool:
+    """
+    Apply status updates in order, printing one combined report.
+
+    A failed update is reported and skipped; the rest still run.
+
+    Returns:
+        True if every update succeeded
+    """
+    out = []
+    errors = []
+    to_archive = []
+
+    for doc_id, status in updates:
+        try:
+            filepath, old_status, should_archive = update_document_status(doc_id, status, project_dir)
+        except (FileNotFoundError, ValueError) as e:
+            errors.append(f"Error: {e}\n")
+            continue
+
+        out.append(f"Updated: {filepath}\n")
+        out.append(f"Status: {old_status} -> {status.title()}\n")
+        if should_archive:
+            to_archive.append((doc_id, status))
+
+    if len(updates) == 1:
+        for doc_id, status in to_archive:
+            out.append(f"\nNote: This document is now {status.title()}.\n")
+            out.append(f"Consider archiving it with: python3 archive.py {doc_id}\n")
+    elif to_archive:
+        out.append("\nConsider archiving:\n")
+        for doc_id, status in to_archive:
+            out.append(f"  python3 archive.py {doc_id}  # now {status.title()}\n")
+
+    sys.stdout.write(''.join(out))
+    sys.stderr.write(''.join(errors))
+    return not errors
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Update the status of a planning document.'
     )
     parser.add_argument(
         'doc_id',
+        nargs='?',
         help='Document ID (e.g., ADR-001, FDP-002, AP-003, RPT-001)'
     )
     parser.add_argument(
         'status',
+        nargs='?',
         help='New status (e.g., accepted, "in progress", completed, published)'
     )
+    parser.add_argument(
+        '--batch',
+        metavar='FILE',
+        help="Read '<doc-id> <new-status>' lines from FILE ('-' for stdin)"
+    )
     parser.add_argument(
         '--project-dir',
         type=Path,
@@ -204,19 +217,20 @@ def main():
 
     args = parser.parse_args()
 
-    try:
-        filepath, old_status, should_archive = update_document_status(
-            args.doc_id, args.status, args.project_dir
-        )
-        print(f"Updated: {filepath}")
-        print(f"Status: {old_status} -> {args.status.title()}")
-
-        if should_archive:
-            print(f"\nNote: This document is now {args.status.title()}.")
-            print(f"Consider archiving it with: python3 archive.py {args.doc_id}")
+    if args.batch:
+        if args.doc_id:
+            parser.error("--batch does not take a document ID")
+        try:
+            updates = read_batch(args.batch)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+    elif args.status:
+        updates = [(args.doc_id, args.status)]
+    else:
+        parser.error("expected <doc-id> <new-status> or --batch FILE")
 
-    except (FileNotFoundError, ValueError) as e:
-        print(f"Error: {e}", file=sys.stderr)
+    if not run_updates(updates, args.project_dir):
         sys.exit(1)
 
 
@@ -19,11 +19,18 @@ Examples:
 """
 
 import argparse
-import importlib.util
+import functools
 import json
 import os
 import sys
+from bisect import bisect_right
 from pathlib import Path
+from types import ModuleType
+
+from config import get_json_loads
+
+# Loaded migration modules by version
+_migration_cache: dict[str, ModuleType] = {}
 
 
 def get_project_dir() -> Path:
@@ -45,12 +52,78 @@ def get_migrations_dir() -> Path:
     return get_plugin_root() / 'migrations'
 
 
+@functools.lru_cache(maxsize=8)
+def read_json(path: Path, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a JSON file (cached).
+
+    The file's mtime and size are part of the cache key, so an edited file
+    is re-read.
+    """
+    data = path.read_bytes()
+    return get_json_loads()(data)
+
+
+def load_json(path: Path) -> dict | None:
+    """Load a JSON file through the cache, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return read_json(path, stat.st_mtime_ns, stat.st_size)
+
+
+def parse_version(version: str) -> tuple[int, ...]:
+    """
+    Parse a dotted version string into a tuple that compares numerically.
+
+    Raises:
+        ValueError: If the version is not dot-separated numbers (e.g. 0.2.0)
+    """
+    try:
+        return tuple(int(part) for part in str(version).split('.'))
+    except ValueError:
+        raise ValueError(f"Invalid version '{version}'. Expected numbers separated by dots, e.g. 0.2.0") from None
+
+
+def sort_versions(manifest: dict) -> None:
+    """
+    Store the manifest's versions sorted for bisect lookups.
+
+    Adds '_sorted' (version entries in ascending order) and '_keys' (their
+    parsed versions). The manifest is cached, so this runs once per load.
+    """
+    entries = sorted(manifest.get('versions', []), key=lambda v: parse_version(v['version']))
+    manifest['_sorted'] = entries
+    manifest['_keys'] = [parse_version(v['version']) for v in entries]
+
+
 def load_manifest() -> dict:
-    """Load the migrations manifest."""
-    manifest_path = get_migrations_dir() / 'manifest.json'
-    if not manifest_path.exists():
-        return {'versions': [], 'current': '0.1.0'}
-    return json.loads(manifest_path.read_text())
+    """Load the migrations manifest, with its versions sorted (see sort_versions)."""
+    manifest = load_json(get_migrations_dir() / 'manifest.json')
+    if manifest is None:
+        manifest = {'versions': [], 'current': '0.1.0'}
+    if '_keys' not in manifest:
+        sort_versions(manifest)
+    return manifest
+
+
+def versions_between(manifest: dict, current: str, target: str | None = None) -> list[dict]:
+    """
+    Get the manifest's versions newer than current, up to and including target.
+
+    Args:
+        manifest: Manifest returned by load_manifest()
+        current: Version the project is at
+        target: Newest version to include (default: no limit)
+
+    Returns:
+        Version entries in ascending version order
+    """
+    keys = manifest['_keys']
+    start = bisect_right(keys, parse_version(current))
+    end = bisect_right(keys, parse_version(target)) if target else len(keys)
+    return manifest['_sorted'][start:end]
 
 
 def get_config_path(project_dir: Path) -> Path:
@@ -60,13 +133,10 @@ def get_config_path(project_dir: Path) -> Path:
 
 def load_project_config(project_dir: Path) -> dict:
     """Load project configuration."""
-    config_path = get_config_path(project_dir)
-    if config_path.exists():
-        try:
-            return json.loads(config_path.read_text())
-        except (json.JSONDecodeError, IOError):
-            return {}
-    return {}
+    try:
+        return load_json(get_config_path(project_dir)) or {}
+    except (json.JSONDecodeError, IOError):
+        return {}
 
 
 def get_project_version(project_dir: Path) -> str:
@@ -76,16 +146,31 @@ def get_project_version(project_dir: Path) -> str:
 
 
 def load_migration_module(version: str):
-    """Dynamically load a migration module."""
+    """
+    Dynamically load a migration module.
+
+    Modules are loaded once per process and registered in sys.modules, so a
+    dry run followed by the real upgrade does not execute migrate.py twice.
+    """
+    module = _migration_cache.get(version)
+    if module:
+        return module
+
     migrations_dir = get_migrations_dir()
     migrate_path = migrations_dir / f'v{version}' / 'migrate.py'
 
     if not migrate_path.exists():
         return None
 
+    # Only needed when a migration is actually run, so not imported up front
+    import importlib.util
+
     spec = importlib.util.spec_from_file_location(f'migrate_{version}', migrate_path)
     module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
     spec.loader.exec_module(module)
+
+    _migration_cache[version] = module
     return module
 
 
@@ -96,22 +181,27 @@ def cmd_status(args):
     current = get_project_version(project_dir)
     latest = manifest.get('current', '0.1.0')
 
-    print(f"Project: {project_dir}")
-    print(f"Current version: {current}")
-    print(f"Latest version: {latest}")
+    # Output is collected and written once
+    out = []
+    emit = out.append
+
+    emit(f"Project: {project_dir}\n")
+    emit(f"Current version: {current}\n")
+    emit(f"Latest version: {latest}\n")
 
-    if current < latest:
-        print(f"\nUpgrade available!")
-        print(f"Run 'vibe-doc upgrade' to upgrade to {latest}")
+    if parse_version(current) < parse_version(latest):
+        emit(f"\nUpgrade available!\n")
+        emit(f"Run 'vibe-doc upgrade' to upgrade to {latest}\n")
 
         # Show versions between current and latest
-        print("\nVersions to apply:")
-        for v in manifest.get('versions', []):
-            if v['version'] > current:
-                breaking = " (BREAKING)" if v.get('breaking') else ""
-                print(f"  {v['version']}: {v['description']}{breaking}")
+        emit("\nVersions to apply:\n")
+        for v in versions_between(manifest, current):
+            breaking = " (BREAKING)" if v.get('breaking') else ""
+            emit(f"  {v['version']}: {v['description']}{breaking}\n")
     else:
-        print("\nYou're up to date!")
+        emit("\nYou're up to date!\n")
+
+    sys.stdout.write(''.join(out))
 
 
 def cmd_upgrade(args):
@@ -121,62 +211,72 @@ def cmd_upgrade(args):
     current = get_project_version(project_dir)
     target = args.to or manifest.get('current', '0.1.0')
 
-    if current >= target:
+    if parse_version(current) >= parse_version(target):
         print(f"Already at version {current}, no upgrade needed.")
         return 0
 
     # Find versions to apply
-    versions_to_apply = [
-        v for v in manifest.get('versions', [])
-        if v['version'] > current and v['version'] <= target
-    ]
+    versions_to_apply = versions_between(manifest, current, target)
 
     if not versions_to_apply:
         print(f"No migrations to apply.")
         return 0
 
+    # Output is collected and written in as few writes as possible
+    out = []
+    emit = out.append
+
+    def flush():
+        sys.stdout.write(''.join(out))
+        out.clear()
+
     # Dry run mode
     if args.dry_run:
-        print("Dry run - showing what would change:\n")
+        emit("Dry run - showing what would change:\n\n")
         for v in versions_to_apply:
-            print(f"=== Version {v['version']} ===")
+            emit(f"=== Version {v['version']} ===\n")
             if v.get('migration'):
                 module = load_migration_module(v['version'])
                 if module and hasattr(module, 'dry_run'):
                     changes = module.dry_run(project_dir)
                     if changes:
                         for change in changes:
-                            print(f"  - {change}")
+                            emit(f"  - {change}\n")
                     else:
-                        print("  No changes needed")
+                        emit("  No changes needed\n")
                 else:
-                    print("  Migration script not found or missing dry_run")
+                    emit("  Migration script not found or missing dry_run\n")
             else:
-                print("  No migration script (metadata only)")
-            print()
+                emit("  No migration script (metadata only)\n")
+            emit("\n")
+        flush()
         return 0
 
     # Apply migrations
-    print(f"Upgrading from {current} to {target}...\n")
+    emit(f"Upgrading from {current} to {target}...\n\n")
 
     for v in versions_to_apply:
-        print(f"=== Applying {v['version']} ===")
+        emit(f"=== Applying {v['version']} ===\n")
 
         if v.get('migration'):
             module = load_migration_module(v['version'])
             if module and hasattr(module, 'migrate'):
+                # Migrations print their own progress; keep it in order
+                flush()
                 success = module.migrate(project_dir)
                 if not success:
-                    print(f"Migration {v['version']} failed!")
+                    emit(f"Migration {v['version']} failed!\n")
+                    flush()
                     return 1
             else:
-                print(f"Warning: Migration script not found for {v['version']}")
+                emit(f"Warning: Migration script not found for {v['version']}\n")
         else:
-            print("No migration needed (metadata update only)")
+            emit("No migration needed (metadata update only)\n")
 
-        print()
+        emit("\n")
 
-    print(f"Successfully upgraded to {target}!")
+    emit(f"Successfully upgraded to {target}!\n")
+    flush()
     return 0
 
 
@@ -193,14 +293,14 @@ def cmd_changelog(args):
             print(f"No changelog found for version {version}")
             return 1
     else:
-        # Show manifest summary
+        # Show manifest summary, written once
         manifest = load_manifest()
-        print("Available versions:\n")
+        out = ["Available versions:\n\n"]
         for v in manifest.get('versions', []):
             breaking = " [BREAKING]" if v.get('breaking') else ""
-            print(f"  {v['version']} ({v['date']}){breaking}")
-            print(f"    {v['description']}")
-            print()
+            out.append(f"  {v['version']} ({v['date']}){breaking}\n")
+            out.append(f"    {v['description']}\n\n")
+        sys.stdout.write(''.join(out))
 
 
 def main():
@@ -235,7 +335,11 @@ def main():
         parser.print_help()
         return 1
 
-    return args.func(args) or 0
+    try:
+        return args.func(args) or 0
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
 
 
 if __name__ == '__main__':